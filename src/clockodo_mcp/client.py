@@ -12,21 +12,142 @@ Pattern: Pure HTTP client - no business logic
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
-from dataclasses import dataclass
+import threading
+import time
+import urllib.request
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Callable, NoReturn
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
 DEFAULT_BASE_URL = "https://my.clockodo.com/api/"
 
+# Upper bound on concurrent requests issued by batch helpers
+# (keeps fan-out well within Clockodo's rate limits)
+MAX_BATCH_WORKERS = 8
 
-@dataclass
-class ClockodoClient:
+# Version suffix like "v2/" at the end of a configured base URL
+_VERSION_SUFFIX_RE = re.compile(r"v\d+/?$")
+
+# Only per-request header; auth headers are configured on the pooled client
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Seconds to keep slowly-changing reference data (users, customers, ...) cached
+DEFAULT_CACHE_TTL = 300.0
+
+# Connection pool sizing for the persistent HTTP client.
+# All requests go to a single host, so a small pool is sufficient.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+)
+
+# Reads may be slow for large reports, but an unreachable host should fail fast
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Retries for failed connection attempts (e.g. a dropped keep-alive socket).
+# httpx never retries once a request was sent, so writes are not duplicated.
+CONNECT_RETRIES = 2
+
+
+def _transport(proxy: str | None = None) -> httpx.HTTPTransport:
+    """Build the pooled, retrying HTTP/2 transport, optionally via a proxy."""
+    return httpx.HTTPTransport(
+        http2=True, limits=DEFAULT_POOL_LIMITS, retries=CONNECT_RETRIES, proxy=proxy
+    )
+
+
+def _proxy_mounts() -> dict[str, httpx.HTTPTransport | None]:
+    """
+    Build transports for the HTTP(S)_PROXY, ALL_PROXY and NO_PROXY settings.
+
+    httpx ignores environment proxies once a custom transport is passed, so
+    they are mounted explicitly (None routes a pattern to the direct transport).
+    NO_PROXY hosts also match their subdomains; "*" disables proxying.
+    """
+    proxies = urllib.request.getproxies()
+    no_proxy = [host.strip() for host in proxies.pop("no", "").split(",")]
+    if "*" in no_proxy:
+        return {}
+
+    mounts: dict[str, httpx.HTTPTransport | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            if "://" not in url:
+                url = f"http://{url}"
+            mounts[f"{scheme}://"] = _transport(url)
+    if not mounts:
+        return mounts
+    for host in filter(None, no_proxy):
+        mounts[host if "://" in host else f"all://*{host}"] = None
+    return mounts
+
+
+def _raise_with_detail(resp: httpx.Response, error: httpx.HTTPStatusError) -> NoReturn:
+    """
+    Re-raise an HTTP error with the response body included in the message.
+
+    The body is already buffered by httpx, so it is decoded exactly once.
+    Non-JSON bodies (e.g., HTML error pages) are included as truncated text.
+    """
+    body = resp.content
+    try:
+        detail = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        detail = body[:512].decode("utf-8", "replace")
+    logger.error("API Error: %s - %s", error, detail)
+    raise httpx.HTTPStatusError(
+        f"{error} - Details: {detail}",
+        request=error.request,
+        response=error.response,
+    ) from error
+
+
+def _mask(value: str | None, missing: str = "NOT_SET") -> str:
+    """Describe whether a (possibly secret) setting is present for logging."""
+    return "SET" if value else missing
+
+
+def _read_cache_file(path: Path) -> dict | None:
+    """Load a cached JSON response, or None if missing or unreadable."""
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+
+def _write_cache_file(path: Path, data: dict) -> None:
+    """Atomically store a JSON response; failures only log a warning."""
+    try:
+        # Reports contain personal HR data: keep the directory private
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write cache file %s: %s", path, e)
+
+
+# One public method per API endpoint, and the settings plus the state derived
+# from them (headers, HTTP pool, cache) are all per client; splitting the
+# class would only spread that state around.
+@dataclass(slots=True, weakref_slot=True)
+class ClockodoClient:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """
     HTTP client for Clockodo REST API.
 
@@ -34,6 +155,15 @@ class ClockodoClient:
     - All dependencies via constructor
     - Testable by mocking
     - No global state
+
+    Reference data (users, customers, services, projects) changes rarely and
+    is cached per instance for `cache_ttl` seconds (0 disables caching), as
+    are user reports, which the HR tools request repeatedly for one year.
+    If `cache_dir` is set, user reports of past years are persisted there.
+    Cached responses are shared by all callers and must be treated as
+    read-only; copy them before modifying.
+    `user_id` optionally records the numeric ID of the `api_user` account so
+    that callers can skip looking it up via `list_users()`.
     """
 
     api_user: str
@@ -41,6 +171,15 @@ class ClockodoClient:
     user_agent: str | None = None
     base_url: str = DEFAULT_BASE_URL
     external_app_contact: str | None = None
+    cache_ttl: float = DEFAULT_CACHE_TTL
+    cache_dir: str | None = None
+    user_id: int | None = None
+    _default_headers: dict[str, str] = field(init=False, repr=False, compare=False)
+    _http: httpx.Client = field(init=False, repr=False, compare=False)
+    _cache: dict[str, tuple[float, dict]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _finalizer: weakref.finalize = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Normalize base_url to always end with /api/ and no version prefix."""
@@ -49,7 +188,7 @@ class ClockodoClient:
             self.base_url += "/"
 
         # Strip version suffixes like /v2/, /v3/, /v4/
-        self.base_url = re.sub(r"v\d+/?$", "", self.base_url)
+        self.base_url = _VERSION_SUFFIX_RE.sub("", self.base_url)
 
         # Ensure it ends with /api/
         if not self.base_url.endswith("/api/"):
@@ -60,6 +199,42 @@ class ClockodoClient:
                 # but only if it's not already there
                 self.base_url = self.base_url.rstrip("/") + "/api/"
 
+        # Headers only depend on constructor arguments, so build them once
+        app_name = self.user_agent or "clockodo-mcp"
+        contact = self.external_app_contact or self.api_user
+        self._default_headers = {
+            "X-ClockodoApiUser": self.api_user,
+            "X-ClockodoApiKey": self.api_key,
+            "X-Clockodo-External-Application": f"{app_name};{contact}",
+            # Provide a minimal default user agent if not set explicitly
+            "User-Agent": self.user_agent or "clockodo-mcp/unknown",
+        }
+
+        # Persistent client: keeps TCP/TLS connections alive between calls and
+        # multiplexes concurrent requests over one HTTP/2 connection. The auth
+        # headers never vary per request, so they are set on the client once.
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            headers=self._default_headers,
+            timeout=DEFAULT_TIMEOUT,
+            transport=_transport(),
+            mounts=_proxy_mounts(),
+        )
+        # Release pooled sockets when the client is garbage collected or the
+        # interpreter exits, even if close() was never called. A finalizer
+        # (unlike atexit.register) does not keep the client alive.
+        self._finalizer = weakref.finalize(self, self._http.close)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._finalizer()
+
+    def __enter__(self) -> "ClockodoClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @classmethod
     def from_env(cls) -> "ClockodoClient":
         """
@@ -74,21 +249,32 @@ class ClockodoClient:
         user_agent = os.getenv("CLOCKODO_USER_AGENT")
         base_url = os.getenv("CLOCKODO_BASE_URL", DEFAULT_BASE_URL)
         external_app_contact = os.getenv("CLOCKODO_EXTERNAL_APP_CONTACT")
+        cache_ttl = float(os.getenv("CLOCKODO_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+        cache_dir = os.getenv("CLOCKODO_CACHE_DIR") or None
+        user_id_env = os.getenv("CLOCKODO_USER_ID")
+        user_id = int(user_id_env) if user_id_env else None
 
         # Log environment variable status (mask sensitive values)
-        logger.info(
-            "ClockodoClient.from_env() - Environment variables: "
-            "CLOCKODO_API_USER=%s, "
-            "CLOCKODO_API_KEY=%s, "
-            "CLOCKODO_USER_AGENT=%s, "
-            "CLOCKODO_BASE_URL=%s, "
-            "CLOCKODO_EXTERNAL_APP_CONTACT=%s",
-            "SET" if api_user else "MISSING",
-            "SET" if api_key else "MISSING",
-            "SET" if user_agent else "NOT_SET",
-            base_url,
-            "SET" if external_app_contact else "NOT_SET",
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "ClockodoClient.from_env() - Environment variables: "
+                "CLOCKODO_API_USER=%s, "
+                "CLOCKODO_API_KEY=%s, "
+                "CLOCKODO_USER_AGENT=%s, "
+                "CLOCKODO_BASE_URL=%s, "
+                "CLOCKODO_EXTERNAL_APP_CONTACT=%s, "
+                "CLOCKODO_CACHE_TTL=%s, "
+                "CLOCKODO_CACHE_DIR=%s, "
+                "CLOCKODO_USER_ID=%s",
+                _mask(api_user, "MISSING"),
+                _mask(api_key, "MISSING"),
+                _mask(user_agent),
+                base_url,
+                _mask(external_app_contact),
+                cache_ttl,
+                cache_dir or "NOT_SET",
+                user_id if user_id is not None else "NOT_SET",
+            )
 
         return cls(
             api_user=api_user,
@@ -96,23 +282,15 @@ class ClockodoClient:
             user_agent=user_agent,
             base_url=base_url,
             external_app_contact=external_app_contact,
+            cache_ttl=cache_ttl,
+            cache_dir=cache_dir,
+            user_id=user_id,
         )
 
     @property
     def default_headers(self) -> dict[str, str]:
-        app_name = self.user_agent or "clockodo-mcp"
-        contact = self.external_app_contact or self.api_user
-        headers: dict[str, str] = {
-            "X-ClockodoApiUser": self.api_user,
-            "X-ClockodoApiKey": self.api_key,
-            "X-Clockodo-External-Application": f"{app_name};{contact}",
-        }
-        if self.user_agent:
-            headers["User-Agent"] = self.user_agent
-        else:
-            # Provide a minimal default user agent if not set explicitly
-            headers["User-Agent"] = "clockodo-mcp/unknown"
-        return headers
+        """Authentication and identification headers sent with every request."""
+        return self._default_headers
 
     def _request(
         self,
@@ -120,46 +298,134 @@ class ClockodoClient:
         endpoint: str,
         params: dict | None = None,
         json_data: dict | None = None,
-        timeout: float = 30.0,
     ) -> dict:
         """
         Make HTTP request to Clockodo API.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
-            endpoint: API endpoint path (e.g., "users", "entries")
+            endpoint: API endpoint path relative to base_url, without a
+                leading slash (e.g., "v3/users", "v2/entries")
             params: Query parameters
             json_data: JSON body for POST/PUT requests
-            timeout: Request timeout in seconds
+
+        Requests use the client's DEFAULT_TIMEOUT.
 
         Returns:
             JSON response as dictionary
+
+        Raises:
+            ValueError: If endpoint starts with "/". httpx would still resolve
+                it under base_url, but call sites keep one canonical relative
+                form
         """
-        url = f"{self.base_url}{endpoint}"
-        resp = httpx.request(
+        if endpoint.startswith("/"):
+            raise ValueError(
+                f"endpoint must be relative, without a leading slash: {endpoint}"
+            )
+        headers = None
+        content = None
+        if json_data is not None:
+            # Encode with orjson instead of httpx's stdlib json path
+            content = orjson.dumps(json_data)
+            headers = _JSON_CONTENT_TYPE
+        resp = self._http.request(
             method=method,
-            url=url,
-            headers=self.default_headers,
+            url=endpoint,
+            headers=headers,
             params=params,
-            json=json_data,
-            timeout=timeout,
+            content=content,
         )
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
-            # Include response body in the error message for better debugging
-            try:
-                error_detail = resp.json()
-                logger.error("API Error: %s - %s", e, error_detail)
-                # Re-raise with detail in message
-                raise httpx.HTTPStatusError(
-                    f"{e} - Details: {error_detail}",
-                    request=e.request,
-                    response=e.response,
-                ) from e
-            except Exception as parse_error:
-                raise e from parse_error
-        return resp.json()
+            _raise_with_detail(resp, e)
+        return orjson.loads(resp.content)
+
+    def _write(self, method: str, endpoint: str, json_data: dict | None = None) -> dict:
+        """
+        Make a mutating request and drop the cached user reports.
+
+        Entries and absences feed the overtime and vacation figures in
+        userreports, so cached reports are stale once a write goes out.
+        They are dropped even if the request fails, since the write may
+        still have been applied.
+        """
+        try:
+            return self._request(method, endpoint, json_data=json_data)
+        finally:
+            self.invalidate(prefix="userreports:")
+
+    def _list(self, endpoint: str, key: str, params: dict | None = None) -> dict:
+        """
+        GET a collection endpoint and normalize its result key.
+
+        Newer API versions return collections under a generic 'data' key;
+        it is mirrored to the plural resource key (e.g., 'users').
+
+        Args:
+            endpoint: API endpoint path (e.g., "v3/users")
+            key: Plural result key (e.g., "users")
+            params: Query parameters
+
+        Returns:
+            JSON response with the collection available under `key`
+        """
+        resp = self._request("GET", endpoint, params=params)
+        data = resp.get("data")
+        if data is not None and key not in resp:
+            resp[key] = data
+        return resp
+
+    def _cached_get(self, key: str, endpoint: str) -> dict:
+        """
+        GET a reference-data endpoint, serving it from the TTL cache when fresh.
+
+        Args:
+            key: Cache key and plural result key (e.g., "users")
+            endpoint: API endpoint path (e.g., "v3/users")
+
+        Returns:
+            JSON response with the collection available under `key`
+        """
+        return self._get_cached(key, lambda: self._list(endpoint, key))
+
+    def _get_cached(self, key: str, fetch: Callable[[], dict]) -> dict:
+        """Return the fresh cache entry for `key`, or call `fetch` and cache it."""
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        resp = fetch()
+        if self.cache_ttl > 0:
+            # Keys are per year/user/type level, so sweep expired ones on
+            # every store instead of letting them pile up for the process.
+            for stale, (expires, _) in list(self._cache.items()):
+                if expires <= now:
+                    self._cache.pop(stale, None)
+            self._cache[key] = (now + self.cache_ttl, resp)
+        return resp
+
+    def invalidate(self, key: str | None = None, prefix: str | None = None) -> None:
+        """
+        Drop cached reference data and user reports.
+
+        Args:
+            key: Cache key to drop (e.g., "users")
+            prefix: Drop every key starting with this (e.g., "userreports:")
+
+        With neither argument, everything is dropped.
+        """
+        if key is None and prefix is None:
+            self._cache.clear()
+            return
+        if key is not None:
+            self._cache.pop(key, None)
+        if prefix is not None:
+            for cached in list(self._cache):
+                if cached.startswith(prefix):
+                    self._cache.pop(cached, None)
 
     # ==============================================
     # API Endpoints
@@ -172,11 +438,7 @@ class ClockodoClient:
         Returns:
             Dictionary with 'users' key containing list of user objects
         """
-        resp = self._request("GET", "v3/users")
-        # Normalize response (pattern change: 'data' instead of 'users')
-        if "data" in resp and "users" not in resp:
-            resp["users"] = resp["data"]
-        return resp
+        return self._cached_get("users", "v3/users")
 
     def list_customers(self) -> dict:
         """
@@ -185,11 +447,7 @@ class ClockodoClient:
         Returns:
             Dictionary with 'customers' key containing list of customer objects
         """
-        resp = self._request("GET", "v3/customers")
-        # Normalize response (pattern change: 'data' instead of 'customers')
-        if "data" in resp and "customers" not in resp:
-            resp["customers"] = resp["data"]
-        return resp
+        return self._cached_get("customers", "v3/customers")
 
     def list_services(self) -> dict:
         """
@@ -198,11 +456,7 @@ class ClockodoClient:
         Returns:
             Dictionary with 'services' key containing list of service objects
         """
-        resp = self._request("GET", "v4/services")
-        # Normalize v4 response (pattern change: 'data' instead of 'services')
-        if "data" in resp and "services" not in resp:
-            resp["services"] = resp["data"]
-        return resp
+        return self._cached_get("services", "v4/services")
 
     def list_projects(self) -> dict:
         """
@@ -211,14 +465,14 @@ class ClockodoClient:
         Returns:
             Dictionary with 'projects' key containing list of project objects
         """
-        resp = self._request("GET", "v4/projects")
-        # Normalize v4 response (pattern change: 'data' instead of 'projects')
-        if "data" in resp and "projects" not in resp:
-            resp["projects"] = resp["data"]
-        return resp
+        return self._cached_get("projects", "v4/projects")
 
     def get_user_reports(
-        self, year: int, user_id: int | None = None, type_level: int = 0
+        self,
+        year: int,
+        user_id: int | None = None,
+        type_level: int = 0,
+        use_cache: bool = True,
     ) -> dict:
         """
         Get user reports for a specific year.
@@ -231,38 +485,68 @@ class ClockodoClient:
             year: Year to fetch (e.g., 2024, 2025)
             user_id: Optional specific user ID to filter
             type_level: Report detail level (0=year only, up to 4=detailed)
+            use_cache: If False, always query the API, bypassing the memory
+                and disk caches (the fresh response is not cached)
 
         Returns:
             Dictionary with 'userreports' key containing list of report objects
+            (shared with other callers when cached; do not modify)
         """
+        if not use_cache:
+            return self._fetch_user_reports(
+                year, user_id, type_level, use_disk_cache=False
+            )
+        return self._get_cached(
+            f"userreports:{year}:{user_id}:{type_level}",
+            lambda: self._fetch_user_reports(year, user_id, type_level),
+        )
+
+    def _fetch_user_reports(
+        self,
+        year: int,
+        user_id: int | None,
+        type_level: int,
+        use_disk_cache: bool = True,
+    ) -> dict:
+        """Fetch user reports, using the disk cache for past years if enabled."""
         params: dict[str, int] = {"year": year, "type": type_level}
         if user_id is not None:
             params["users_id"] = user_id
 
-        # userreports is v1 API: /api/userreports
-        url = f"{self.base_url}userreports"
-
-        resp = httpx.request(
-            method="GET",
-            url=url,
-            headers=self.default_headers,
-            params=params,
-            timeout=30.0,
+        cache_path = (
+            self._report_cache_path(year, user_id, type_level)
+            if use_disk_cache
+            else None
         )
-        try:
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            try:
-                error_detail = resp.json()
-                logger.error("API Error (v1): %s - %s", e, error_detail)
-                raise httpx.HTTPStatusError(
-                    f"{e} - Details: {error_detail}",
-                    request=e.request,
-                    response=e.response,
-                ) from e
-            except Exception as parse_error:
-                raise e from parse_error
-        return resp.json()
+        if cache_path is not None:
+            cached = _read_cache_file(cache_path)
+            if cached is not None:
+                return cached
+
+        # userreports is v1 API: base_url already ends in /api/ (no version)
+        resp = self._request("GET", "userreports", params=params)
+        if cache_path is not None:
+            _write_cache_file(cache_path, resp)
+        return resp
+
+    def _report_cache_path(
+        self, year: int, user_id: int | None, type_level: int
+    ) -> Path | None:
+        """
+        Get the disk cache file for a user report, if it may be cached.
+
+        Only past years are cached: their reports are treated as final.
+        The file name includes the API version and a hash of the account,
+        so different accounts or endpoint versions never share entries.
+        """
+        if not self.cache_dir or year >= date.today().year:
+            return None
+        account = hashlib.sha256(
+            f"{self.base_url}|{self.api_user}".encode()
+        ).hexdigest()[:16]
+        users = "all" if user_id is None else user_id
+        name = f"userreports-v1-{account}-{year}-{users}-{type_level}.json"
+        return Path(self.cache_dir).expanduser() / name
 
     # ==============================================
     # Clock Operations (v2 is the latest as of 2026-01-14)
@@ -300,7 +584,7 @@ class ClockodoClient:
             data["projects_id"] = projects_id
         if text is not None:
             data["text"] = text
-        return self._request("POST", "v2/clock", json_data=data)
+        return self._write("POST", "v2/clock", json_data=data)
 
     def clock_stop(self, entry_id: int) -> dict:
         """
@@ -309,7 +593,7 @@ class ClockodoClient:
         Args:
             entry_id: ID of the running clock entry to stop
         """
-        return self._request("DELETE", f"v2/clock/{entry_id}")
+        return self._write("DELETE", f"v2/clock/{entry_id}")
 
     # ==============================================
     # Entries (v2 is the latest as of 2026-01-14)
@@ -337,6 +621,37 @@ class ClockodoClient:
             params["filter[users_id]"] = user_id
         return self._request("GET", "v2/entries", params=params)
 
+    def list_entries_batch(
+        self,
+        time_since: str,
+        time_until: str,
+        user_ids: list[int],
+    ) -> dict[int, dict]:
+        """
+        List time entries for several users over the same time range.
+
+        Requests are issued concurrently (at most MAX_BATCH_WORKERS at a time)
+        over the shared connection pool, so total latency is close to a
+        single round trip instead of one round trip per user.
+
+        Args:
+            time_since: Start time in ISO 8601 UTC format (e.g., "2021-01-01T00:00:00Z")
+            time_until: End time in ISO 8601 UTC format (e.g., "2021-02-01T00:00:00Z")
+            user_ids: User IDs to fetch entries for
+
+        Returns:
+            Dictionary mapping each user ID to its list_entries response
+        """
+        if not user_ids:
+            return {}
+
+        def fetch(user_id: int) -> dict:
+            return self.list_entries(time_since, time_until, user_id=user_id)
+
+        workers = min(MAX_BATCH_WORKERS, len(user_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(user_ids, executor.map(fetch, user_ids)))
+
     def create_entry(
         self,
         customers_id: int,
@@ -374,15 +689,15 @@ class ClockodoClient:
             data["text"] = text
         if user_id is not None:
             data["users_id"] = user_id
-        return self._request("POST", "v2/entries", json_data=data)
+        return self._write("POST", "v2/entries", json_data=data)
 
     def edit_entry(self, entry_id: int, data: dict) -> dict:
         """Edit an existing time entry."""
-        return self._request("PUT", f"v2/entries/{entry_id}", json_data=data)
+        return self._write("PUT", f"v2/entries/{entry_id}", json_data=data)
 
     def delete_entry(self, entry_id: int) -> dict:
         """Delete a time entry."""
-        return self._request("DELETE", f"v2/entries/{entry_id}")
+        return self._write("DELETE", f"v2/entries/{entry_id}")
 
     # ==============================================
     # Absences (v4)
@@ -390,11 +705,7 @@ class ClockodoClient:
 
     def list_absences(self, year: int) -> dict:
         """List absences for a year (v4 API)."""
-        resp = self._request("GET", "v4/absences", params={"filter[year]": year})
-        # Normalize v4 response
-        if "data" in resp and "absences" not in resp:
-            resp["absences"] = resp["data"]
-        return resp
+        return self._list("v4/absences", "absences", params={"filter[year]": year})
 
     def create_absence(
         self,
@@ -423,7 +734,7 @@ class ClockodoClient:
             data["users_id"] = user_id
         if status is not None:
             data["status"] = status
-        return self._request("POST", "v4/absences", json_data=data)
+        return self._write("POST", "v4/absences", json_data=data)
 
     def edit_absence(self, absence_id: int, data: dict) -> dict:
         """
@@ -433,8 +744,53 @@ class ClockodoClient:
             absence_id: Absence ID
             data: Dictionary with fields to update
         """
-        return self._request("PUT", f"v4/absences/{absence_id}", json_data=data)
+        return self._write("PUT", f"v4/absences/{absence_id}", json_data=data)
 
     def delete_absence(self, absence_id: int) -> dict:
         """Delete an absence."""
-        return self._request("DELETE", f"v4/absences/{absence_id}")
+        return self._write("DELETE", f"v4/absences/{absence_id}")
+
+
+# The shared client lives in a dict so it can be replaced without `global`
+_DEFAULT_CLIENT: dict[str, ClockodoClient] = {}
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+# Callbacks that drop objects still holding on to the shared client
+_RESET_HOOKS: list[Callable[[], None]] = []
+
+
+def get_default_client() -> ClockodoClient:
+    """
+    Return the process-wide client built from environment variables.
+
+    Tool handlers share this instance so they reuse one connection pool and
+    one reference data cache instead of creating a client per call.
+    """
+    client = _DEFAULT_CLIENT.get("client")
+    if client is None:
+        with _DEFAULT_CLIENT_LOCK:
+            client = _DEFAULT_CLIENT.get("client")
+            if client is None:
+                client = _DEFAULT_CLIENT["client"] = ClockodoClient.from_env()
+    return client
+
+
+def on_default_client_reset(hook: Callable[[], None]) -> Callable[[], None]:
+    """
+    Register a callback run by reset_default_client().
+
+    Use it to clear caches that keep a reference to the shared client, so
+    they pick up the new one instead of the closed instance.
+    """
+    _RESET_HOOKS.append(hook)
+    return hook
+
+
+def reset_default_client() -> None:
+    """Close and discard the shared client (e.g. after env changes in tests)."""
+    with _DEFAULT_CLIENT_LOCK:
+        client = _DEFAULT_CLIENT.pop("client", None)
+    for hook in _RESET_HOOKS:
+        hook()
+    if client is not None:
+        client.close()
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 
 class Role(str, Enum):
@@ -34,7 +36,96 @@ class FeatureGroup(str, Enum):
     ADMIN_EDIT = "admin_edit"
 
 
-@dataclass
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+
+
+def _get_bool(key: str, default: bool = False) -> bool:
+    """Parse a boolean environment variable, falling back to default."""
+    value = os.getenv(key, "").strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return default
+
+
+def _flags(
+    *,
+    hr_readonly: bool = False,
+    user_read: bool = False,
+    user_edit: bool = False,
+    team_leader: bool = False,
+    admin_read: bool = False,
+    admin_edit: bool = False,
+) -> MappingProxyType[str, bool]:
+    """Build a read-only feature flag mapping for a role or preset."""
+    return MappingProxyType(
+        {
+            "hr_readonly": hr_readonly,
+            "user_read": user_read,
+            "user_edit": user_edit,
+            "team_leader": team_leader,
+            "admin_read": admin_read,
+            "admin_edit": admin_edit,
+        }
+    )
+
+
+_EMPLOYEE_FLAGS = _flags(user_read=True, user_edit=True)
+_TEAM_LEADER_FLAGS = _flags(user_read=True, user_edit=True, team_leader=True)
+_HR_ANALYTICS_FLAGS = _flags(hr_readonly=True)
+_ADMIN_FLAGS = _flags(
+    hr_readonly=True,
+    user_read=True,
+    user_edit=True,
+    team_leader=True,
+    admin_read=True,
+    admin_edit=True,
+)
+
+# Feature flags per CLOCKODO_MCP_ROLE value
+_ROLE_FLAGS = MappingProxyType(
+    {
+        Role.EMPLOYEE.value: _EMPLOYEE_FLAGS,
+        Role.TEAM_LEADER.value: _TEAM_LEADER_FLAGS,
+        Role.HR_ANALYTICS.value: _HR_ANALYTICS_FLAGS,
+        Role.ADMIN.value: _ADMIN_FLAGS,
+    }
+)
+
+# Feature flags per legacy CLOCKODO_MCP_PRESET value
+_PRESET_FLAGS = MappingProxyType(
+    {
+        "readonly": _HR_ANALYTICS_FLAGS,
+        "user": _EMPLOYEE_FLAGS,
+        "team_leader": _TEAM_LEADER_FLAGS,
+        "admin": _ADMIN_FLAGS,
+    }
+)
+
+
+def _classify_role(
+    hr_readonly: bool,
+    user_read: bool,
+    user_edit: bool,
+    team_leader: bool,
+    admin_read: bool,
+    admin_edit: bool,
+) -> str:
+    """Derive the role name for one combination of feature flags."""
+    if all((hr_readonly, user_read, user_edit, team_leader, admin_read, admin_edit)):
+        return "admin"
+    if user_read and user_edit and team_leader and not hr_readonly:
+        return "team_leader"
+    if hr_readonly and not user_read and not team_leader:
+        return "hr_analytics"
+    if user_read and user_edit and not hr_readonly and not team_leader:
+        return "employee"
+    return "custom"
+
+
+@dataclass(slots=True, frozen=True)
 class ServerConfig:  # pylint: disable=too-many-instance-attributes
     """
     Configuration for MCP server features.
@@ -65,6 +156,29 @@ class ServerConfig:  # pylint: disable=too-many-instance-attributes
     transport: str = "stdio"
     host: str = "0.0.0.0"
     port: int = 8000
+    _enabled: frozenset[FeatureGroup] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+    _role: str = field(init=False, repr=False, compare=False, default="custom")
+    _feature_names: tuple[str, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self):
+        """Precompute enabled features and role name (config is immutable)."""
+        flags = (
+            (FeatureGroup.HR_READONLY, self.hr_readonly),
+            (FeatureGroup.USER_READ, self.user_read),
+            (FeatureGroup.USER_EDIT, self.user_edit),
+            (FeatureGroup.TEAM_LEADER, self.team_leader),
+            (FeatureGroup.ADMIN_READ, self.admin_read),
+            (FeatureGroup.ADMIN_EDIT, self.admin_edit),
+        )
+        enabled = frozenset(feature for feature, on in flags if on)
+        object.__setattr__(self, "_enabled", enabled)
+        role = _classify_role(*(on for _, on in flags))
+        object.__setattr__(self, "_role", role)
+        object.__setattr__(self, "_feature_names", self._describe_features())
 
     @classmethod
     def from_env(cls) -> "ServerConfig":
@@ -78,7 +192,6 @@ class ServerConfig:  # pylint: disable=too-many-instance-attributes
         """
         role = os.getenv("CLOCKODO_MCP_ROLE", "").lower()
 
-        # Apply role-based configuration (primary method)
         # Transport configuration (applies to all roles)
         transport = os.getenv("CLOCKODO_MCP_TRANSPORT", "stdio").lower()
         if transport not in ("stdio", "sse"):
@@ -86,124 +199,23 @@ class ServerConfig:  # pylint: disable=too-many-instance-attributes
         host = os.getenv("CLOCKODO_MCP_HOST", "0.0.0.0")
         port = int(os.getenv("CLOCKODO_MCP_PORT", "8000"))
 
-        role_configs = {
-            Role.EMPLOYEE.value: {
-                "hr_readonly": False,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": False,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            Role.TEAM_LEADER.value: {
-                "hr_readonly": False,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": True,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            Role.HR_ANALYTICS.value: {
-                "hr_readonly": True,
-                "user_read": False,
-                "user_edit": False,
-                "team_leader": False,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            Role.ADMIN.value: {
-                "hr_readonly": True,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": True,
-                "admin_read": True,
-                "admin_edit": True,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-        }
-
-        if role in role_configs:
-            return cls(**role_configs[role])  # type: ignore[arg-type]
-
-        # Legacy preset support
-        preset = os.getenv("CLOCKODO_MCP_PRESET", "").lower()
-        preset_configs = {
-            "readonly": {
-                "hr_readonly": True,
-                "user_read": False,
-                "user_edit": False,
-                "team_leader": False,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            "user": {
-                "hr_readonly": False,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": False,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            "team_leader": {
-                "hr_readonly": False,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": True,
-                "admin_read": False,
-                "admin_edit": False,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-            "admin": {
-                "hr_readonly": True,
-                "user_read": True,
-                "user_edit": True,
-                "team_leader": True,
-                "admin_read": True,
-                "admin_edit": True,
-                "transport": transport,
-                "host": host,
-                "port": port,
-            },
-        }
-
-        if preset in preset_configs:
-            return cls(**preset_configs[preset])  # type: ignore[arg-type]
+        # Apply role-based configuration (primary method)
+        flags = _ROLE_FLAGS.get(role)
+        if flags is None:
+            # Legacy preset support
+            preset = os.getenv("CLOCKODO_MCP_PRESET", "").lower()
+            flags = _PRESET_FLAGS.get(preset)
+        if flags is not None:
+            return cls(**flags, transport=transport, host=host, port=port)
 
         # Legacy individual flags support
-        def get_bool(key: str, default: bool = False) -> bool:
-            value = os.getenv(key, "").lower()
-            if value in ("true", "1", "yes", "on"):
-                return True
-            if value in ("false", "0", "no", "off"):
-                return False
-            return default
-
         return cls(
-            hr_readonly=get_bool("CLOCKODO_MCP_ENABLE_HR_READONLY", False),
-            user_read=get_bool("CLOCKODO_MCP_ENABLE_USER_READ", True),
-            user_edit=get_bool("CLOCKODO_MCP_ENABLE_USER_EDIT", True),
-            team_leader=get_bool("CLOCKODO_MCP_ENABLE_TEAM_LEADER", False),
-            admin_read=get_bool("CLOCKODO_MCP_ENABLE_ADMIN_READ", False),
-            admin_edit=get_bool("CLOCKODO_MCP_ENABLE_ADMIN_EDIT", False),
+            hr_readonly=_get_bool("CLOCKODO_MCP_ENABLE_HR_READONLY", False),
+            user_read=_get_bool("CLOCKODO_MCP_ENABLE_USER_READ", True),
+            user_edit=_get_bool("CLOCKODO_MCP_ENABLE_USER_EDIT", True),
+            team_leader=_get_bool("CLOCKODO_MCP_ENABLE_TEAM_LEADER", False),
+            admin_read=_get_bool("CLOCKODO_MCP_ENABLE_ADMIN_READ", False),
+            admin_edit=_get_bool("CLOCKODO_MCP_ENABLE_ADMIN_EDIT", False),
             transport=transport,
             host=host,
             port=port,
@@ -211,56 +223,21 @@ class ServerConfig:  # pylint: disable=too-many-instance-attributes
 
     def is_enabled(self, feature: FeatureGroup) -> bool:
         """Check if a feature group is enabled."""
-        feature_map = {
-            FeatureGroup.HR_READONLY: self.hr_readonly,
-            FeatureGroup.USER_READ: self.user_read,
-            FeatureGroup.USER_EDIT: self.user_edit,
-            FeatureGroup.TEAM_LEADER: self.team_leader,
-            FeatureGroup.ADMIN_READ: self.admin_read,
-            FeatureGroup.ADMIN_EDIT: self.admin_edit,
-        }
-        return feature_map.get(feature, False)
+        return feature in self._enabled
 
     def get_role_name(self) -> str:
         """Get the role name based on enabled features."""
-        is_admin = (
-            self.hr_readonly
-            and self.user_read
-            and self.user_edit
-            and self.team_leader
-            and self.admin_read
-            and self.admin_edit
-        )
-        if is_admin:
-            return "admin"
-
-        is_team_leader = (
-            self.user_read
-            and self.user_edit
-            and self.team_leader
-            and not self.hr_readonly
-        )
-        if is_team_leader:
-            return "team_leader"
-
-        if self.hr_readonly and not self.user_read and not self.team_leader:
-            return "hr_analytics"
-
-        is_employee = (
-            self.user_read
-            and self.user_edit
-            and not self.hr_readonly
-            and not self.team_leader
-        )
-        if is_employee:
-            return "employee"
-        return "custom"
+        return self._role
 
     def get_enabled_features(self) -> list[str]:
         """Get list of enabled feature names."""
+        return list(self._feature_names)
+
+    def _describe_features(self) -> tuple[str, ...]:
+        """Build the human-readable feature summary (computed once on init)."""
         role = self.get_role_name()
         if role != "custom":
-            return [f"Role: {role}"]
+            return (f"Role: {role}",)
 
         # For custom configurations, list individual features
         enabled = []
@@ -274,4 +251,15 @@ class ServerConfig:  # pylint: disable=too-many-instance-attributes
             enabled.append("Team Management")
         if self.admin_read or self.admin_edit:
             enabled.append("Admin Access")
-        return enabled if enabled else ["No features enabled"]
+        return tuple(enabled) if enabled else ("No features enabled",)
+
+
+@lru_cache(maxsize=1)
+def get_server_config() -> ServerConfig:
+    """
+    Return the process-wide configuration parsed from environment variables.
+
+    The environment does not change while the server runs, so it is read
+    once. Call `get_server_config.cache_clear()` to re-read it (e.g. in tests).
+    """
+    return ServerConfig.from_env()
@@ -36,17 +36,18 @@ def normalize_datetime(value: str | None) -> str | None:
     if value is None:
         return None
 
-    # Replace space separator with T
-    normalized = value.replace(" ", "T", 1)
-
-    # Validate by parsing
+    # Python 3.11+ parses both the space separator and a trailing "Z" natively,
+    # so a single parse validates the input and tells us if it has a timezone
     try:
-        datetime.fromisoformat(normalized.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(value)
     except (ValueError, TypeError) as exc:
         raise ValueError(f"Invalid datetime format: {value!r}") from exc
 
+    # Replace space separator with T (skip the copy for the common "T" form)
+    normalized = value.replace(" ", "T", 1) if " " in value else value
+
     # Append Z if no timezone info present
-    if "+" not in normalized and not normalized.endswith("Z"):
+    if parsed.tzinfo is None:
         normalized += "Z"
 
     return normalized
@@ -1,5 +1,65 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable, Iterator
+
+
+def _overtime_hours(report: dict) -> float:
+    """Total overtime in hours: this period's diff plus carried-over overtime."""
+    diff_seconds = report.get("diff") or 0
+    carryover_seconds = report.get("overtime_carryover") or 0
+    return float(diff_seconds) / 3600 + float(carryover_seconds) / 3600
+
+
+def _vacation_days(report: dict) -> tuple[float, float, float]:
+    """Return (used, remaining, total_available) vacation days of a report."""
+    quota = report.get("holidays_quota") or 0
+    carry = report.get("holidays_carry") or 0
+    sum_absence = report.get("sum_absence") or {}
+    used = float(sum_absence.get("regular_holidays") or 0.0)
+
+    total_available = quota + carry
+    return used, total_available - used, total_available
+
+
+def _overtime_excess(overtime_hours: float, max_hours: float) -> float | None:
+    """Return the hours above max_hours, or None if within the limit."""
+    if overtime_hours > max_hours:
+        return overtime_hours - max_hours
+    return None
+
+
+def _vacation_violation(
+    used: float,
+    remaining: float,
+    total_available: float,
+    min_days_used: float,
+    max_days_remaining: float,
+) -> tuple[str, str, float] | None:
+    """
+    Apply the vacation rules to one user's vacation days.
+
+    Returns:
+        (violation_type, detail_key, detail_days), or None if compliant
+    """
+    # If no vacation is available, it's always successful
+    if total_available <= 0:
+        return None
+
+    # Check if too many vacation days remaining (higher priority)
+    if remaining > max_days_remaining:
+        return (
+            "excessive_vacation_remaining",
+            "excess_days",
+            remaining - max_days_remaining,
+        )
+
+    # Check if too few vacation days used
+    if used < min_days_used:
+        return "insufficient_vacation_taken", "days_short", min_days_used - used
+
+    return None
+
 
 def analyze_overtime(report: dict, max_hours_threshold: float) -> dict:
     """
@@ -12,24 +72,17 @@ def analyze_overtime(report: dict, max_hours_threshold: float) -> dict:
     Returns:
         Dictionary with overtime analysis results
     """
-    # Convert seconds to hours
-    diff_seconds = report.get("diff") or 0
-    carryover_seconds = report.get("overtime_carryover") or 0
-
-    diff_hours = float(diff_seconds) / 3600
-    carryover_hours = float(carryover_seconds) / 3600
-    total_overtime = diff_hours + carryover_hours
-
-    has_violation = total_overtime > max_hours_threshold
+    total_overtime = _overtime_hours(report)
+    excess = _overtime_excess(total_overtime, max_hours_threshold)
 
     result = {
-        "has_violation": has_violation,
+        "has_violation": excess is not None,
         "overtime_hours": total_overtime,
         "threshold": max_hours_threshold,
     }
 
-    if has_violation:
-        result["excess_hours"] = total_overtime - max_hours_threshold
+    if excess is not None:
+        result["excess_hours"] = excess
 
     return result
 
@@ -48,13 +101,7 @@ def analyze_vacation(
     Returns:
         Dictionary with vacation analysis results
     """
-    quota = report.get("holidays_quota") or 0
-    carry = report.get("holidays_carry") or 0
-    sum_absence = report.get("sum_absence") or {}
-    used = float(sum_absence.get("regular_holidays") or 0.0)
-
-    total_available = quota + carry
-    remaining = total_available - used
+    used, remaining, total_available = _vacation_days(report)
 
     result = {
         "used_days": used,
@@ -63,21 +110,14 @@ def analyze_vacation(
         "has_violation": False,
     }
 
-    # If no vacation is available, it's always successful
-    if total_available <= 0:
-        return result
-
-    # Check if too many vacation days remaining (higher priority)
-    if remaining > max_days_remaining:
-        result["has_violation"] = True
-        result["violation_type"] = "excessive_vacation_remaining"
-        result["excess_days"] = remaining - max_days_remaining
-
-    # Check if too few vacation days used
-    elif used < min_days_used:
+    violation = _vacation_violation(
+        used, remaining, total_available, min_days_used, max_days_remaining
+    )
+    if violation is not None:
+        violation_type, detail_key, detail_days = violation
         result["has_violation"] = True
-        result["violation_type"] = "insufficient_vacation_taken"
-        result["days_short"] = min_days_used - used
+        result["violation_type"] = violation_type
+        result[detail_key] = detail_days
 
     return result
 
@@ -86,54 +126,94 @@ def get_hr_violations(reports: dict, config: dict) -> list[dict]:
     """
     Get list of all HR violations across all users.
 
+    See iter_hr_violations() for the arguments; this materializes its results.
+    """
+    return list(iter_hr_violations(reports, config))
+
+
+def iter_hr_violations(reports: dict, config: dict) -> Iterator[dict]:
+    """
+    Yield the HR violations of each user, one report at a time.
+
+    See iter_report_violations() for the config; reports is the wrapper
+    dict from the Clockodo API (a missing or null list yields nothing).
+    """
+    return iter_report_violations(reports.get("userreports") or [], config)
+
+
+def iter_report_violations(
+    user_reports: Iterable[dict], config: dict
+) -> Iterator[dict]:
+    """
+    Yield the HR violations of each user report.
+
     Args:
-        reports: User reports data from Clockodo API
+        user_reports: The "userreports" list from the Clockodo API
         config: Configuration with thresholds
             - max_overtime_hours: Maximum overtime threshold
             - min_vacation_days: Minimum vacation days to use
             - max_vacation_remaining: Maximum vacation days that can remain
 
-    Returns:
-        List of dictionaries with user violations
+    Yields:
+        Dictionary with the user's violations (empty list if compliant)
     """
-    violations = []
-
-    for report in reports.get("userreports") or []:
-        user_violations = {
+    max_overtime = config["max_overtime_hours"]
+    min_vacation = config["min_vacation_days"]
+    max_remaining = config["max_vacation_remaining"]
+    default_year = config.get("year", 0)
+    # An unlimited threshold (or no minimum) disables that check entirely
+    check_overtime = max_overtime != math.inf
+    check_vacation = min_vacation > 0 or max_remaining != math.inf
+
+    # Single pass per report with the same rules as analyze_overtime() and
+    # analyze_vacation(), without building their intermediate result dicts
+    for report in user_reports:
+        found = []
+        if check_overtime:
+            finding = _overtime_finding(report, max_overtime)
+            if finding is not None:
+                found.append(finding)
+        if check_vacation:
+            finding = _vacation_finding(report, min_vacation, max_remaining)
+            if finding is not None:
+                found.append(finding)
+
+        yield {
             "user_id": report.get("users_id"),
             "user_name": report.get("users_name"),
-            "year": report.get("year", config.get("year", 0)),
-            "violations": [],
+            "year": report.get("year", default_year),
+            "violations": found,
         }
 
-        # Check overtime
-        overtime_result = analyze_overtime(report, config["max_overtime_hours"])
-        if overtime_result["has_violation"]:
-            user_violations["violations"].append(
-                {
-                    "type": "excessive_overtime",
-                    "overtime_hours": overtime_result["overtime_hours"],
-                    "threshold": overtime_result["threshold"],
-                    "excess_hours": overtime_result["excess_hours"],
-                }
-            )
-
-        # Check vacation
-        vacation_result = analyze_vacation(
-            report, config["min_vacation_days"], config["max_vacation_remaining"]
-        )
-        if vacation_result["has_violation"]:
-            violation = {
-                "type": vacation_result["violation_type"],
-                "used_days": vacation_result["used_days"],
-                "remaining_days": vacation_result["remaining_days"],
-            }
-            if "days_short" in vacation_result:
-                violation["days_short"] = vacation_result["days_short"]
-            if "excess_days" in vacation_result:
-                violation["excess_days"] = vacation_result["excess_days"]
-            user_violations["violations"].append(violation)
-
-        violations.append(user_violations)
-
-    return violations
+
+def _overtime_finding(report: dict, max_overtime: float) -> dict | None:
+    """Build the overtime violation entry of one report, if any."""
+    overtime = _overtime_hours(report)
+    excess = _overtime_excess(overtime, max_overtime)
+    if excess is None:
+        return None
+    return {
+        "type": "excessive_overtime",
+        "overtime_hours": overtime,
+        "threshold": max_overtime,
+        "excess_hours": excess,
+    }
+
+
+def _vacation_finding(
+    report: dict, min_vacation: float, max_remaining: float
+) -> dict | None:
+    """Build the vacation violation entry of one report, if any."""
+    used, remaining, total_available = _vacation_days(report)
+    violation = _vacation_violation(
+        used, remaining, total_available, min_vacation, max_remaining
+    )
+    if violation is None:
+        return None
+    violation_type, detail_key, detail_days = violation
+    return {
+        "type": violation_type,
+        "used_days": used,
+        "remaining_days": remaining,
+        detail_key: detail_days,
+    }
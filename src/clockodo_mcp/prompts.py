@@ -21,12 +21,11 @@ def get_start_work_prompt(
     Returns:
         Formatted prompt string
     """
-    if project:
-        return (
-            f"Start tracking time for customer '{customer}', "
-            f"project '{project}', service '{service}'"
-        )
-    return f"Start tracking time for customer '{customer}', service '{service}'"
+    project_part = f"project '{project}', " if project else ""
+    return (
+        f"Start tracking time for customer '{customer}', "
+        f"{project_part}service '{service}'"
+    )
 
 
 def get_stop_work_prompt() -> str:
@@ -54,13 +53,11 @@ def get_add_time_entry_prompt(
     Returns:
         Formatted prompt string
     """
-    prompt = (
+    description_part = f" with description: {description}" if description else ""
+    return (
         f"Add a time entry for {duration_hours} hours on {date} "
-        f"for customer '{customer}', service '{service}'"
+        f"for customer '{customer}', service '{service}'{description_part}"
     )
-    if description:
-        prompt += f" with description: {description}"
-    return prompt
 
 
 def get_vacation_request_prompt(start_date: str, end_date: str) -> str:
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
-from .client import ClockodoClient
+from .client import get_default_client
 
 
 def get_current_time_entry_resource() -> dict:
@@ -18,7 +18,7 @@ def get_current_time_entry_resource() -> dict:
     Returns:
         Dictionary with current time entry data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     clock = client.get_clock()
 
     if not clock or "running" not in clock:
@@ -47,7 +47,7 @@ def get_user_profile_resource() -> dict:
     Returns:
         Dictionary with user profile data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     users = client.list_users()
 
     # Find the authenticated user (the API returns all users, but we can identify the current user)
@@ -68,19 +68,20 @@ def get_customers_resource() -> dict:
     Returns:
         Dictionary with customers data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     customers = client.list_customers()
 
     customer_list = customers.get("customers", [])
+    count = len(customer_list)
     customer_names = [c.get("name", "Unknown") for c in customer_list]
 
     return {
         "uri": "clockodo://customers",
         "name": "Customers List",
-        "description": f"Available customers ({len(customer_list)} total)",
+        "description": f"Available customers ({count} total)",
         "mimeType": "application/json",
         "content": {
-            "count": len(customer_list),
+            "count": count,
             "customers": customer_list,
             "names": customer_names,
         },
@@ -94,19 +95,20 @@ def get_services_resource() -> dict:
     Returns:
         Dictionary with services data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     services = client.list_services()
 
     service_list = services.get("services", [])
+    count = len(service_list)
     service_names = [s.get("name", "Unknown") for s in service_list]
 
     return {
         "uri": "clockodo://services",
         "name": "Services List",
-        "description": f"Available services ({len(service_list)} total)",
+        "description": f"Available services ({count} total)",
         "mimeType": "application/json",
         "content": {
-            "count": len(service_list),
+            "count": count,
             "services": service_list,
             "names": service_names,
         },
@@ -120,19 +122,20 @@ def get_projects_resource() -> dict:
     Returns:
         Dictionary with projects data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     projects = client.list_projects()
 
     project_list = projects.get("projects", [])
+    count = len(project_list)
     project_names = [p.get("name", "Unknown") for p in project_list]
 
     return {
         "uri": "clockodo://projects",
         "name": "Projects List",
-        "description": f"Available projects ({len(project_list)} total)",
+        "description": f"Available projects ({count} total)",
         "mimeType": "application/json",
         "content": {
-            "count": len(project_list),
+            "count": count,
             "projects": project_list,
             "names": project_names,
         },
@@ -149,23 +152,24 @@ def get_recent_entries_resource(days: int = 7) -> dict:
     Returns:
         Dictionary with recent entries data
     """
-    client = ClockodoClient.from_env()
+    client = get_default_client()
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
 
-    time_since = start_date.strftime("%Y-%m-%d 00:00:00")
-    time_until = end_date.strftime("%Y-%m-%d 23:59:59")
+    time_since = start_date.date().isoformat() + " 00:00:00"
+    time_until = end_date.date().isoformat() + " 23:59:59"
 
     entries = client.list_entries(time_since=time_since, time_until=time_until)
     entry_list = entries.get("entries", [])
+    count = len(entry_list)
 
     return {
         "uri": f"clockodo://recent-entries?days={days}",
         "name": f"Recent Time Entries (Last {days} Days)",
-        "description": f"Time entries from the last {days} days ({len(entry_list)} entries)",
+        "description": f"Time entries from the last {days} days ({count} entries)",
         "mimeType": "application/json",
         "content": {
-            "count": len(entry_list),
+            "count": count,
             "entries": entry_list,
             "period": {"start": time_since, "end": time_until},
         },
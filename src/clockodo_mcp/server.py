@@ -10,24 +10,32 @@ Pattern: Server Layer (Layer 1)
 - Uses configuration to enable/disable features
 
 Architecture: Server → Service → Client
+
+Importing this module only sets up the always-available tools, prompts and
+resources. Role-scoped tools are added by register_tools(), which main() calls.
+Hosts that import `mcp` directly (e.g. `mcp run` / `mcp dev`, or an embedding
+application) must call register_tools() themselves before serving.
 """
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
+from itertools import chain
 
+import anyio
+import orjson
 from mcp.server.fastmcp import FastMCP  # type: ignore
 
 from . import prompts as prompt_templates
 from . import resources as resource_handlers
-from .client import ClockodoClient
-from .config import FeatureGroup, ServerConfig
+from .client import get_default_client, on_default_client_reset
+from .config import FeatureGroup, ServerConfig, get_server_config
 from .services.team_leader_service import TeamLeaderService
 from .tools import debug_tools, hr_tools, team_leader_tools, user_tools
 
 # Pattern #2: Configuration Management
 # Load configuration from environment variables with safe defaults
-config = ServerConfig.from_env()
+config = get_server_config()
 
 # Create MCP server instance with configured host and port
 mcp = FastMCP("clockodo", host=config.host, port=config.port)
@@ -45,29 +53,25 @@ def health() -> dict[str, str | list[str]]:
 @mcp.tool()
 def list_users() -> dict:
     """List all users from Clockodo API."""
-    client = ClockodoClient.from_env()
-    return client.list_users()
+    return get_default_client().list_users()
 
 
 @mcp.tool()
 def list_customers() -> dict:
     """List all customers from Clockodo API."""
-    client = ClockodoClient.from_env()
-    return client.list_customers()
+    return get_default_client().list_customers()
 
 
 @mcp.tool()
 def list_services() -> dict:
     """List all services from Clockodo API."""
-    client = ClockodoClient.from_env()
-    return client.list_services()
+    return get_default_client().list_services()
 
 
 @mcp.tool()
 def list_projects() -> dict:
     """List all projects from Clockodo API."""
-    client = ClockodoClient.from_env()
-    return client.list_projects()
+    return get_default_client().list_projects()
 
 
 @mcp.tool()
@@ -129,39 +133,247 @@ def request_vacation(start_date: str, end_date: str) -> str:
 # ==============================================
 
 
+def _dumps(content: dict) -> str:
+    """Serialize resource content as compact JSON (read by machines, not humans)."""
+    return orjson.dumps(content).decode()
+
+
 @mcp.resource("clockodo://current-entry")
 def current_entry() -> str:
     """Get the currently running time entry."""
     resource = resource_handlers.get_current_time_entry_resource()
-    return json.dumps(resource["content"], indent=2)
+    return _dumps(resource["content"])
 
 
 @mcp.resource("clockodo://customers")
 def customers_list() -> str:
     """Get the list of available customers."""
     resource = resource_handlers.get_customers_resource()
-    return json.dumps(resource["content"], indent=2)
+    return _dumps(resource["content"])
 
 
 @mcp.resource("clockodo://services")
 def services_list() -> str:
     """Get the list of available services."""
     resource = resource_handlers.get_services_resource()
-    return json.dumps(resource["content"], indent=2)
+    return _dumps(resource["content"])
 
 
 @mcp.resource("clockodo://projects")
 def projects_list() -> str:
     """Get the list of available projects."""
     resource = resource_handlers.get_projects_resource()
-    return json.dumps(resource["content"], indent=2)
+    return _dumps(resource["content"])
 
 
 @mcp.resource("clockodo://recent-entries")
 def recent_entries() -> str:
     """Get recent time entries (last 7 days)."""
     resource = resource_handlers.get_recent_entries_resource(days=7)
-    return json.dumps(resource["content"], indent=2)
+    return _dumps(resource["content"])
+
+
+# ==============================================
+# Feature Tools (registered per enabled feature)
+# ==============================================
+
+
+# HR tools fetch a whole year of reports; they run the blocking client call in
+# a worker thread so the event loop keeps serving other requests meanwhile.
+async def check_overtime_compliance(year: int, max_overtime_hours: float = 80) -> dict:
+    """
+    Check which employees have excessive overtime.
+
+    Args:
+        year: Year to check (e.g., 2024)
+        max_overtime_hours: Maximum allowed overtime hours (default: 80)
+
+    Returns:
+        Dictionary with overtime violations
+    """
+    return await anyio.to_thread.run_sync(
+        hr_tools.check_overtime_compliance, year, max_overtime_hours
+    )
+
+
+async def check_vacation_compliance(
+    year: int, min_vacation_days: float = 10, max_vacation_remaining: float = 20
+) -> dict:
+    """
+    Check which employees have vacation compliance issues.
+
+    Args:
+        year: Year to check (e.g., 2024)
+        min_vacation_days: Minimum vacation days that should be used (default: 10)
+        max_vacation_remaining: Maximum vacation days that can remain unused (default: 20)
+
+    Returns:
+        Dictionary with vacation violations
+    """
+    return await anyio.to_thread.run_sync(
+        hr_tools.check_vacation_compliance,
+        year,
+        min_vacation_days,
+        max_vacation_remaining,
+    )
+
+
+async def get_hr_summary(
+    year: int,
+    max_overtime_hours: float = 80,
+    min_vacation_days: float = 10,
+    max_vacation_remaining: float = 20,
+) -> dict:
+    """
+    Get complete HR compliance summary for all employees.
+
+    Args:
+        year: Year to check (e.g., 2024)
+        max_overtime_hours: Maximum allowed overtime hours (default: 80)
+        min_vacation_days: Minimum vacation days that should be used (default: 10)
+        max_vacation_remaining: Maximum vacation days that can remain unused (default: 20)
+
+    Returns:
+        Dictionary with complete HR summary including all violations
+    """
+    return await anyio.to_thread.run_sync(
+        hr_tools.get_hr_summary,
+        year,
+        max_overtime_hours,
+        min_vacation_days,
+        max_vacation_remaining,
+    )
+
+
+def get_my_clock() -> dict:
+    """Get the currently running clock for the authenticated user."""
+    return user_tools.get_my_clock()
+
+
+def get_my_time_entries(time_since: str, time_until: str) -> dict:
+    """
+    Get time entries for the authenticated user in a given time range.
+
+    Args:
+        time_since: Start time (e.g., 2025-01-01T00:00:00Z)
+        time_until: End time (e.g., 2025-01-01T23:59:59Z)
+    """
+    return user_tools.get_my_entries(time_since, time_until)
+
+
+def start_my_clock(
+    customers_id: int,
+    services_id: int,
+    billable: int = 1,
+    projects_id: int | None = None,
+    text: str | None = None,
+) -> dict:
+    """
+    Start the clock for the authenticated user.
+
+    Args:
+        customers_id: ID of the customer
+        services_id: ID of the service
+        billable: Whether the entry is billable (1) or not (0)
+        projects_id: Optional project ID
+        text: Optional description
+    """
+    return user_tools.start_my_clock(
+        customers_id=customers_id,
+        services_id=services_id,
+        billable=billable,
+        projects_id=projects_id,
+        text=text,
+    )
+
+
+def stop_my_clock() -> dict:
+    """Stop the currently running clock for the authenticated user."""
+    return user_tools.stop_my_clock()
+
+
+def add_my_vacation(date_since: str, date_until: str) -> dict:
+    """
+    Add a vacation for the authenticated user.
+
+    Args:
+        date_since: Start date (YYYY-MM-DD)
+        date_until: End date (YYYY-MM-DD)
+    """
+    return user_tools.add_my_vacation(date_since, date_until)
+
+
+def add_my_time_entry(
+    customers_id: int,
+    services_id: int,
+    time_since: str,
+    time_until: str,
+    billable: int = 1,
+    projects_id: int | None = None,
+    text: str | None = None,
+) -> dict:
+    """
+    Add a manual time entry for the authenticated user.
+
+    Args:
+        customers_id: ID of the customer
+        services_id: ID of the service
+        time_since: Start time (e.g., 2025-01-01T09:00:00Z)
+        time_until: End time (e.g., 2025-01-01T10:00:00Z)
+        billable: Whether the entry is billable (1) or not (0)
+        projects_id: Optional project ID
+        text: Optional description
+    """
+    return user_tools.add_my_entry(
+        customers_id=customers_id,
+        services_id=services_id,
+        time_since=time_since,
+        time_until=time_until,
+        billable=billable,
+        projects_id=projects_id,
+        text=text,
+    )
+
+
+def edit_my_time_entry(entry_id: int, data: dict) -> dict:
+    """
+    Edit a time entry for the authenticated user.
+
+    Args:
+        entry_id: ID of the entry to edit
+        data: Dictionary of fields to update (e.g., {"text": "new description"})
+    """
+    return user_tools.edit_my_entry(entry_id, data)
+
+
+def delete_my_time_entry(entry_id: int) -> dict:
+    """
+    Delete a time entry for the authenticated user.
+
+    Args:
+        entry_id: ID of the entry to delete
+    """
+    return user_tools.delete_my_entry(entry_id)
+
+
+def delete_my_vacation(absence_id: int) -> dict:
+    """
+    Delete a vacation/absence for the authenticated user.
+
+    Args:
+        absence_id: ID of the absence to delete
+    """
+    return user_tools.delete_my_vacation(absence_id)
+
+
+def get_all_time_entries(user_id: int, start_date: str, end_date: str) -> dict:
+    """Get time entries for any user (admin, placeholder)."""
+    return {"message": "Admin read tools coming soon", "user_id": user_id}
+
+
+def edit_user_time_entry(entry_id: int, hours: float) -> dict:
+    """Edit any user's time entry (admin, placeholder)."""
+    return {"message": "Admin edit tools coming soon", "entry_id": entry_id}
 
 
 # ==============================================
@@ -171,194 +383,68 @@ def recent_entries() -> str:
 
 def _register_hr_tools():
     """Register HR tools."""
-
-    @mcp.tool()
-    def check_overtime_compliance(year: int, max_overtime_hours: float = 80) -> dict:
-        """
-        Check which employees have excessive overtime.
-
-        Args:
-            year: Year to check (e.g., 2024)
-            max_overtime_hours: Maximum allowed overtime hours (default: 80)
-
-        Returns:
-            Dictionary with overtime violations
-        """
-        return hr_tools.check_overtime_compliance(year, max_overtime_hours)
-
-    @mcp.tool()
-    def check_vacation_compliance(
-        year: int, min_vacation_days: float = 10, max_vacation_remaining: float = 20
-    ) -> dict:
-        """
-        Check which employees have vacation compliance issues.
-
-        Args:
-            year: Year to check (e.g., 2024)
-            min_vacation_days: Minimum vacation days that should be used (default: 10)
-            max_vacation_remaining: Maximum vacation days that can remain unused (default: 20)
-
-        Returns:
-            Dictionary with vacation violations
-        """
-        return hr_tools.check_vacation_compliance(
-            year, min_vacation_days, max_vacation_remaining
-        )
-
-    @mcp.tool()
-    def get_hr_summary(
-        year: int,
-        max_overtime_hours: float = 80,
-        min_vacation_days: float = 10,
-        max_vacation_remaining: float = 20,
-    ) -> dict:
-        """
-        Get complete HR compliance summary for all employees.
-
-        Args:
-            year: Year to check (e.g., 2024)
-            max_overtime_hours: Maximum allowed overtime hours (default: 80)
-            min_vacation_days: Minimum vacation days that should be used (default: 10)
-            max_vacation_remaining: Maximum vacation days that can remain unused (default: 20)
-
-        Returns:
-            Dictionary with complete HR summary including all violations
-        """
-        return hr_tools.get_hr_summary(
-            year, max_overtime_hours, min_vacation_days, max_vacation_remaining
-        )
+    for tool in (
+        check_overtime_compliance,
+        check_vacation_compliance,
+        get_hr_summary,
+    ):
+        mcp.tool()(tool)
 
 
 def _register_user_read_tools():
     """Register user read tools."""
+    for tool in (
+        get_my_clock,
+        get_my_time_entries,
+    ):
+        mcp.tool()(tool)
 
-    @mcp.tool()
-    def get_my_clock() -> dict:
-        """Get the currently running clock for the authenticated user."""
-        return user_tools.get_my_clock()
 
-    @mcp.tool()
-    def get_my_time_entries(time_since: str, time_until: str) -> dict:
-        """
-        Get time entries for the authenticated user in a given time range.
+def _register_user_edit_tools():
+    """Register user edit tools."""
+    for tool in (
+        start_my_clock,
+        stop_my_clock,
+        add_my_vacation,
+        add_my_time_entry,
+        edit_my_time_entry,
+        delete_my_time_entry,
+        delete_my_vacation,
+    ):
+        mcp.tool()(tool)
 
-        Args:
-            time_since: Start time (e.g., 2025-01-01T00:00:00Z)
-            time_until: End time (e.g., 2025-01-01T23:59:59Z)
-        """
-        return user_tools.get_my_entries(time_since, time_until)
 
+def _register_team_leader_tools():
+    """Register team leader tools."""
+    # Use lazy client initialization to avoid crashes on invalid credentials
+    team_leader_service = TeamLeaderService(get_default_client)
+    on_default_client_reset(team_leader_service.reset_client)
+    team_leader_tools.register_team_leader_tools(mcp, team_leader_service)
 
-def _register_user_edit_tools():
-    """Register user edit tools."""
 
-    @mcp.tool()
-    def start_my_clock(
-        customers_id: int,
-        services_id: int,
-        billable: int = 1,
-        projects_id: int | None = None,
-        text: str | None = None,
-    ) -> dict:
-        """
-        Start the clock for the authenticated user.
-
-        Args:
-            customers_id: ID of the customer
-            services_id: ID of the service
-            billable: Whether the entry is billable (1) or not (0)
-            projects_id: Optional project ID
-            text: Optional description
-        """
-        return user_tools.start_my_clock(
-            customers_id=customers_id,
-            services_id=services_id,
-            billable=billable,
-            projects_id=projects_id,
-            text=text,
-        )
-
-    @mcp.tool()
-    def stop_my_clock() -> dict:
-        """Stop the currently running clock for the authenticated user."""
-        return user_tools.stop_my_clock()
-
-    @mcp.tool()
-    def add_my_vacation(date_since: str, date_until: str) -> dict:
-        """
-        Add a vacation for the authenticated user.
-
-        Args:
-            date_since: Start date (YYYY-MM-DD)
-            date_until: End date (YYYY-MM-DD)
-        """
-        return user_tools.add_my_vacation(date_since, date_until)
-
-    @mcp.tool()
-    def add_my_time_entry(
-        customers_id: int,
-        services_id: int,
-        time_since: str,
-        time_until: str,
-        billable: int = 1,
-        projects_id: int | None = None,
-        text: str | None = None,
-    ) -> dict:
-        """
-        Add a manual time entry for the authenticated user.
-
-        Args:
-            customers_id: ID of the customer
-            services_id: ID of the service
-            time_since: Start time (e.g., 2025-01-01T09:00:00Z)
-            time_until: End time (e.g., 2025-01-01T10:00:00Z)
-            billable: Whether the entry is billable (1) or not (0)
-            projects_id: Optional project ID
-            text: Optional description
-        """
-        return user_tools.add_my_entry(
-            customers_id=customers_id,
-            services_id=services_id,
-            time_since=time_since,
-            time_until=time_until,
-            billable=billable,
-            projects_id=projects_id,
-            text=text,
-        )
-
-    @mcp.tool()
-    def edit_my_time_entry(entry_id: int, data: dict) -> dict:
-        """
-        Edit a time entry for the authenticated user.
-
-        Args:
-            entry_id: ID of the entry to edit
-            data: Dictionary of fields to update (e.g., {"text": "new description"})
-        """
-        return user_tools.edit_my_entry(entry_id, data)
-
-    @mcp.tool()
-    def delete_my_time_entry(entry_id: int) -> dict:
-        """
-        Delete a time entry for the authenticated user.
-
-        Args:
-            entry_id: ID of the entry to delete
-        """
-        return user_tools.delete_my_entry(entry_id)
-
-    @mcp.tool()
-    def delete_my_vacation(absence_id: int) -> dict:
-        """
-        Delete a vacation/absence for the authenticated user.
-
-        Args:
-            absence_id: ID of the absence to delete
-        """
-        return user_tools.delete_my_vacation(absence_id)
-
-
-def register_tools():
+def _register_admin_read_tools():
+    """Register admin read tools (placeholder)."""
+    mcp.tool()(get_all_time_entries)
+
+
+def _register_admin_edit_tools():
+    """Register admin edit tools (placeholder)."""
+    mcp.tool()(edit_user_time_entry)
+
+
+# Tool registrar per feature group, in registration order
+_REGISTRARS = (
+    (FeatureGroup.HR_READONLY, _register_hr_tools),
+    (FeatureGroup.USER_READ, _register_user_read_tools),
+    (FeatureGroup.USER_EDIT, _register_user_edit_tools),
+    (FeatureGroup.TEAM_LEADER, _register_team_leader_tools),
+    (FeatureGroup.ADMIN_READ, _register_admin_read_tools),
+    (FeatureGroup.ADMIN_EDIT, _register_admin_edit_tools),
+)
+
+
+@lru_cache(maxsize=1)
+def register_tools() -> None:
     """
     Register MCP tools based on enabled features.
 
@@ -366,41 +452,45 @@ def register_tools():
     - Feature flags control which tools are registered
     - No if/else for environments
     - Configuration over code
-    """
 
-    # HR Tools (Read-only)
-    if config.is_enabled(FeatureGroup.HR_READONLY):
-        _register_hr_tools()
-
-    # User Read Tools
-    if config.is_enabled(FeatureGroup.USER_READ):
-        _register_user_read_tools()
-
-    # User Edit Tools
-    if config.is_enabled(FeatureGroup.USER_EDIT):
-        _register_user_edit_tools()
-
-    # Team Leader Tools
-    if config.is_enabled(FeatureGroup.TEAM_LEADER):
-        # Use lazy client initialization to avoid crashes on invalid credentials
-        team_leader_service = TeamLeaderService(ClockodoClient.from_env)
-        team_leader_tools.register_team_leader_tools(mcp, team_leader_service)
-
-    # Admin Read Tools
-    if config.is_enabled(FeatureGroup.ADMIN_READ):
-        # Placeholder for admin read tools
-        @mcp.tool()
-        def get_all_time_entries(user_id: int, start_date: str, end_date: str) -> dict:
-            """Get time entries for any user (admin, placeholder)."""
-            return {"message": "Admin read tools coming soon", "user_id": user_id}
-
-    # Admin Edit Tools
-    if config.is_enabled(FeatureGroup.ADMIN_EDIT):
-        # Placeholder for admin edit tools
-        @mcp.tool()
-        def edit_user_time_entry(entry_id: int, hours: float) -> dict:
-            """Edit any user's time entry (admin, placeholder)."""
-            return {"message": "Admin edit tools coming soon", "entry_id": entry_id}
+    Safe to call more than once; the cache makes later calls no-ops.
+    """
+    for feature, register in _REGISTRARS:
+        if config.is_enabled(feature):
+            register()
+
+
+# Tool names reported by create_server(), always present and per feature group
+_BASE_TOOL_NAMES = (
+    "health",
+    "list_users",
+    "list_customers",
+    "list_services",
+    "list_projects",
+)
+_FEATURE_TOOL_NAMES = {
+    FeatureGroup.HR_READONLY: (
+        "check_overtime_compliance",
+        "check_vacation_compliance",
+        "get_hr_summary",
+    ),
+    FeatureGroup.USER_READ: ("get_my_time_entries",),
+    FeatureGroup.USER_EDIT: ("add_my_time_entry", "delete_my_vacation"),
+    FeatureGroup.TEAM_LEADER: (
+        "list_pending_vacation_requests",
+        "approve_vacation_request",
+        "approve_vacation_requests",
+        "reject_vacation_request",
+        "reject_vacation_requests",
+        "adjust_vacation_dates",
+        "create_team_member_vacation",
+        "create_team_member_vacations",
+        "edit_team_member_entry",
+        "delete_team_member_entry",
+    ),
+    FeatureGroup.ADMIN_READ: ("get_all_time_entries",),
+    FeatureGroup.ADMIN_EDIT: ("edit_user_time_entry",),
+}
 
 
 def create_server(client=None, test_config: ServerConfig | None = None):
@@ -409,6 +499,8 @@ def create_server(client=None, test_config: ServerConfig | None = None):
     test_conf = test_config or config
 
     class MockServer:
+        __slots__ = ("config", "tools", "tool_names")
+
         def __init__(self):
             self.config = test_conf
             self.tools = {
@@ -418,52 +510,20 @@ def create_server(client=None, test_config: ServerConfig | None = None):
                 "list_projects": lambda: client.list_projects() if client else {},
             }
             self.tool_names = [
-                "health",
-                "list_users",
-                "list_customers",
-                "list_services",
-                "list_projects",
+                *_BASE_TOOL_NAMES,
+                *chain.from_iterable(
+                    names
+                    for feature, names in _FEATURE_TOOL_NAMES.items()
+                    if test_conf.is_enabled(feature)
+                ),
             ]
 
-            # Add tool names based on config
-            if test_conf.hr_readonly:
-                self.tool_names.extend(
-                    [
-                        "check_overtime_compliance",
-                        "check_vacation_compliance",
-                        "get_hr_summary",
-                    ]
-                )
-            if test_conf.user_read:
-                self.tool_names.append("get_my_time_entries")
-            if test_conf.user_edit:
-                self.tool_names.extend(["add_my_time_entry", "delete_my_vacation"])
-            if test_conf.team_leader:
-                self.tool_names.extend(
-                    [
-                        "list_pending_vacation_requests",
-                        "approve_vacation_request",
-                        "reject_vacation_request",
-                        "adjust_vacation_dates",
-                        "create_team_member_vacation",
-                        "edit_team_member_entry",
-                        "delete_team_member_entry",
-                    ]
-                )
-            if test_conf.admin_read:
-                self.tool_names.append("get_all_time_entries")
-            if test_conf.admin_edit:
-                self.tool_names.append("edit_user_time_entry")
-
     return MockServer()
 
 
-# Register tools on module load
-register_tools()
-
-
 def main() -> None:
-    """Run the MCP server using configured transport."""
+    """Register enabled tools and run the MCP server on the configured transport."""
+    register_tools()
     if config.transport == "sse":
         mcp.run(transport="sse")
     else:
@@ -15,7 +15,10 @@ Architecture: Server → Service → Client
 from __future__ import annotations
 
 from ..client import ClockodoClient
-from ..hr_analyzer import analyze_overtime, analyze_vacation, get_hr_violations
+from ..hr_analyzer import analyze_overtime, analyze_vacation, iter_report_violations
+
+# Violation-specific fields of analyze_vacation() copied into violations
+_OPTIONAL_VACATION_KEYS = ("days_short", "excess_days")
 
 
 class HRService:
@@ -103,18 +106,20 @@ class HRService:
                 report, min_vacation_days, max_vacation_remaining
             )
             if vacation_result["has_violation"]:
-                violation = {
-                    "user_id": report["users_id"],
-                    "user_name": report["users_name"],
-                    "violation_type": vacation_result["violation_type"],
-                    "used_days": vacation_result["used_days"],
-                    "remaining_days": vacation_result["remaining_days"],
-                }
-                if "days_short" in vacation_result:
-                    violation["days_short"] = vacation_result["days_short"]
-                if "excess_days" in vacation_result:
-                    violation["excess_days"] = vacation_result["excess_days"]
-                violations.append(violation)
+                violations.append(
+                    {
+                        "user_id": report["users_id"],
+                        "user_name": report["users_name"],
+                        "violation_type": vacation_result["violation_type"],
+                        "used_days": vacation_result["used_days"],
+                        "remaining_days": vacation_result["remaining_days"],
+                        **{
+                            key: vacation_result[key]
+                            for key in _OPTIONAL_VACATION_KEYS
+                            if key in vacation_result
+                        },
+                    }
+                )
 
         return {
             "year": year,
@@ -144,6 +149,8 @@ class HRService:
             Dictionary with complete HR summary including all violations
         """
         reports = self.client.get_user_reports(year=year)
+        # Bound once for the count and the scan; tolerates an explicit null
+        user_reports = reports.get("userreports") or ()
 
         config = {
             "year": year,
@@ -152,14 +159,14 @@ class HRService:
             "max_vacation_remaining": max_vacation_remaining,
         }
 
-        all_violations = get_hr_violations(reports, config)
+        # Stream per-user results; only employees with violations are kept
         employees_with_violations = [
-            v for v in all_violations if len(v["violations"]) > 0
+            v for v in iter_report_violations(user_reports, config) if v["violations"]
         ]
 
         return {
             "year": year,
-            "total_employees": len(reports.get("userreports", [])),
+            "total_employees": len(user_reports),
             "employees_with_violations": employees_with_violations,
             "total_employees_with_violations": len(employees_with_violations),
             "config": config,
@@ -12,11 +12,20 @@ Pattern: Service Layer (Layer 2)
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+import httpx
+
+from ..client import MAX_BATCH_WORKERS
 
 if TYPE_CHECKING:
     from ..client import ClockodoClient
 
+_T = TypeVar("_T")
+
 
 class TeamLeaderService:
     """
@@ -37,13 +46,24 @@ class TeamLeaderService:
         """
         self._client_factory = client_factory
         self._client: ClockodoClient | None = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> ClockodoClient:
-        """Lazy-load the client on first access."""
-        if self._client is None:
-            self._client = self._client_factory()
-        return self._client
+        """Lazy-load the client on first access (thread-safe, lock-free after)."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                # Re-check: another thread may have created it while we waited
+                if self._client is None:
+                    self._client = self._client_factory()
+                client = self._client
+        return client
+
+    def reset_client(self) -> None:
+        """Forget the loaded client; the next access calls the factory again."""
+        with self._client_lock:
+            self._client = None
 
     def approve_vacation(self, absence_id: int) -> dict:
         """
@@ -73,20 +93,96 @@ class TeamLeaderService:
         """
         return self.client.edit_absence(absence_id, {"status": 2})
 
-    def list_pending_vacations(self, year: int) -> list[dict]:
+    def approve_vacations(self, absence_ids: list[int]) -> list[dict]:
+        """
+        Approve several vacation/absence requests concurrently.
+
+        The batch is not atomic: a failed request does not stop or undo the
+        others, so check the per-absence outcome.
+
+        Args:
+            absence_ids: IDs of the absences to approve
+
+        Returns:
+            One outcome per absence, in the order of absence_ids:
+            {"absence_id", "ok": True, "result"} or {"absence_id", "ok": False, "error"}
+        """
+        return self._set_statuses(absence_ids, 1)
+
+    def reject_vacations(self, absence_ids: list[int]) -> list[dict]:
+        """
+        Reject several vacation/absence requests concurrently.
+
+        The batch is not atomic: a failed request does not stop or undo the
+        others, so check the per-absence outcome.
+
+        Args:
+            absence_ids: IDs of the absences to reject
+
+        Returns:
+            One outcome per absence, in the order of absence_ids:
+            {"absence_id", "ok": True, "result"} or {"absence_id", "ok": False, "error"}
+        """
+        return self._set_statuses(absence_ids, 2)
+
+    def _set_statuses(self, absence_ids: list[int], status: int) -> list[dict]:
+        """Set the status of each absence concurrently."""
+        client = self.client
+        return self._map_concurrently(
+            lambda absence_id: client.edit_absence(absence_id, {"status": status}),
+            absence_ids,
+            key="absence_id",
+        )
+
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[[_T], dict], items: list[_T], key: str
+    ) -> list[dict]:
+        """
+        Apply func to each item, at most MAX_BATCH_WORKERS at a time.
+
+        API errors are recorded per item instead of raised, because the
+        requests that already succeeded cannot be rolled back.
+
+        Returns:
+            One {key: item, "ok": bool, "result" | "error": ...} dict per item,
+            in the order of items
+        """
+        if not items:
+            return []
+        workers = min(MAX_BATCH_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, item) for item in items]
+
+        outcomes = []
+        for item, future in zip(items, futures):
+            try:
+                outcomes.append({key: item, "ok": True, "result": future.result()})
+            except httpx.HTTPError as e:
+                outcomes.append({key: item, "ok": False, "error": str(e)})
+        return outcomes
+
+    def list_pending_vacations(self, year: int, limit: int | None = None) -> list[dict]:
         """
         List all pending vacation requests (status 0: enquired).
 
         Args:
             year: Year to filter vacations
+            limit: Optional maximum number of requests to return
 
         Returns:
             List of pending absence dictionaries
+
+        Raises:
+            ValueError: If limit is negative
         """
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be zero or positive, got {limit}")
         absences_data = self.client.list_absences(year)
         absences = absences_data.get("absences", [])
-        # Status 0 = enquired (pending approval)
-        return [a for a in absences if a.get("status") == 0]
+        # Status 0 = enquired (pending approval); stop scanning once limit is hit
+        pending = (a for a in absences if a.get("status") == 0)
+        return list(islice(pending, limit))
 
     def edit_team_entry(self, entry_id: int, data: dict) -> dict:
         """
@@ -171,3 +267,41 @@ class TeamLeaderService:
             user_id=user_id,
             status=status,
         )
+
+    def create_team_vacations(
+        self,
+        user_ids: list[int],
+        date_since: str,
+        date_until: str,
+        absence_type: int = 1,
+        auto_approve: bool = False,
+    ) -> list[dict]:
+        """
+        Create the same vacation for several team members concurrently.
+
+        The batch is not atomic: vacations created before a failure are kept.
+        Retry only the users whose outcome is not ok, otherwise the others get
+        duplicate vacations.
+
+        Args:
+            user_ids: User IDs of the team members
+            date_since: Start date (YYYY-MM-DD)
+            date_until: End date (YYYY-MM-DD)
+            absence_type: Type of absence (1: Vacation, 2: Illness, etc.)
+            auto_approve: If True, set status to 1 (approved) immediately
+
+        Returns:
+            One outcome per user, in the order of user_ids:
+            {"user_id", "ok": True, "result"} or {"user_id", "ok": False, "error"}
+        """
+        return self._map_concurrently(
+            lambda user_id: self.create_team_vacation(
+                user_id=user_id,
+                date_since=date_since,
+                date_until=date_until,
+                absence_type=absence_type,
+                auto_approve=auto_approve,
+            ),
+            user_ids,
+            key="user_id",
+        )
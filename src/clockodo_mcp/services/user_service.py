@@ -8,6 +8,7 @@ Pattern: Service Layer (Layer 2)
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import httpx
@@ -17,15 +18,26 @@ from ..date_utils import normalize_datetime
 if TYPE_CHECKING:
     from ..client import ClockodoClient
 
+logger = logging.getLogger(__name__)
+
 
 class UserService:
     """
     Service for user-specific operations like time tracking and vacations.
     """
 
-    def __init__(self, client: ClockodoClient):
+    def __init__(self, client: ClockodoClient, user_id: int | None = None):
+        """
+        Initialize user service.
+
+        Args:
+            client: Clockodo API client
+            user_id: ID of the client's user, if known (skips the lookup)
+        """
         self.client = client
-        self._current_user_id: int | None = None
+        self._current_user_id: int | None = user_id
+        # Entry ID of the clock last seen running; saves get_clock() on stop
+        self._running_entry_id: int | None = None
 
     def get_current_user_id(self) -> int:
         """
@@ -38,13 +50,20 @@ class UserService:
         for user in users_data.get("users", []):
             if user.get("email") == self.client.api_user:
                 self._current_user_id = user["id"]
+                logger.info(
+                    "Resolved user ID %s via /v3/users; set CLOCKODO_USER_ID "
+                    "to skip this lookup",
+                    self._current_user_id,
+                )
                 return self._current_user_id
 
         raise ValueError(f"Could not find user with email {self.client.api_user}")
 
     def get_my_clock(self) -> dict:
         """Get the currently running clock for the user."""
-        return self.client.get_clock()
+        clock_status = self.client.get_clock()
+        self._running_entry_id = (clock_status.get("running") or {}).get("id")
+        return clock_status
 
     def start_my_clock(
         self,
@@ -55,20 +74,32 @@ class UserService:
         text: str | None = None,
     ) -> dict:
         """Start the clock for the current user."""
-        return self.client.clock_start(
+        response = self.client.clock_start(
             customers_id=customers_id,
             services_id=services_id,
             billable=billable,
             projects_id=projects_id,
             text=text,
         )
+        self._running_entry_id = (response.get("running") or {}).get("id")
+        return response
 
     def stop_my_clock(self) -> dict:
         """
         Stop the currently running clock.
 
         This method automatically fetches the running clock ID and stops it.
+        If this service started (or last saw) the running clock, its ID is
+        tried first and the lookup is only done when that stop fails.
         """
+        entry_id, self._running_entry_id = self._running_entry_id, None
+        if entry_id is not None:
+            try:
+                return self.client.clock_stop(entry_id)
+            except httpx.HTTPStatusError:
+                # Stopped or replaced elsewhere; look up the current clock
+                pass
+
         clock_status = self.client.get_clock()
         if clock_status.get("running") and clock_status["running"].get("id"):
             entry_id = clock_status["running"]["id"]
@@ -160,16 +191,19 @@ class UserService:
 
         Note: Absences must be in status 2 (declined), 3 (approval cancelled),
               or 4 (request cancelled) before deletion.
-              This method uses status 3 for approved absences.
+              With auto_cancel, the deletion is tried first and the absence
+              is only cancelled (status 3) if the API rejects it, so already
+              deletable absences need a single request.
         """
-        if auto_cancel:
-            try:
-                self.cancel_my_vacation(absence_id)
-            # pylint: disable-next=broad-exception-caught
-            except (
-                httpx.HTTPStatusError,
-                Exception,
-            ):
-                # If cancelling fails (e.g., already cancelled), try deletion anyway
-                pass
+        try:
+            return self.client.delete_absence(absence_id)
+        except httpx.HTTPStatusError:
+            if not auto_cancel:
+                raise
+
+        try:
+            self.cancel_my_vacation(absence_id)
+        except httpx.HTTPStatusError:
+            # If cancelling fails (e.g., already cancelled), retry deletion anyway
+            pass
         return self.client.delete_absence(absence_id)
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
-from ..client import ClockodoClient
+from ..client import get_default_client
 
 
 def get_raw_user_reports(year: int) -> dict:
     """
     Get raw user reports data from Clockodo API (for debugging).
 
+    Always queries the API; cached reports are bypassed so the result
+    reflects the current server state.
+
     Args:
         year: Year to check (e.g., 2024)
 
     Returns:
         Raw API response from /api/userreports endpoint
     """
-    client = ClockodoClient.from_env()
-    return client.get_user_reports(year=year)
+    return get_default_client().get_user_reports(year=year, use_cache=False)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ..client import ClockodoClient
+from ..client import get_default_client
 from ..services.hr_service import HRService
 
 
@@ -17,8 +17,7 @@ def check_overtime_compliance(year: int, max_overtime_hours: float = 80) -> dict
     Returns:
         Dictionary with overtime violations
     """
-    client = ClockodoClient.from_env()
-    service = HRService(client)
+    service = HRService(get_default_client())
     return service.check_overtime_compliance(year, max_overtime_hours)
 
 
@@ -36,8 +35,7 @@ def check_vacation_compliance(
     Returns:
         Dictionary with vacation violations
     """
-    client = ClockodoClient.from_env()
-    service = HRService(client)
+    service = HRService(get_default_client())
     return service.check_vacation_compliance(
         year, min_vacation_days, max_vacation_remaining
     )
@@ -61,8 +59,7 @@ def get_hr_summary(
     Returns:
         Dictionary with complete HR summary including all violations
     """
-    client = ClockodoClient.from_env()
-    service = HRService(client)
+    service = HRService(get_default_client())
     return service.get_hr_summary(
         year, max_overtime_hours, min_vacation_days, max_vacation_remaining
     )
@@ -26,7 +26,9 @@ def register_team_leader_tools(mcp, service: TeamLeaderService):
     """
 
     @mcp.tool()
-    def list_pending_vacation_requests(year: int) -> list[dict]:
+    def list_pending_vacation_requests(
+        year: int, limit: int | None = None
+    ) -> list[dict]:
         """
         List all pending vacation requests awaiting approval.
 
@@ -35,11 +37,12 @@ def register_team_leader_tools(mcp, service: TeamLeaderService):
 
         Args:
             year: Year to filter vacation requests (e.g., 2024)
+            limit: Optional maximum number of requests to return
 
         Returns:
             List of pending absence dictionaries with user info, dates, and type
         """
-        return service.list_pending_vacations(year)
+        return service.list_pending_vacations(year, limit=limit)
 
     @mcp.tool()
     def approve_vacation_request(absence_id: int) -> dict:
@@ -71,6 +74,42 @@ def register_team_leader_tools(mcp, service: TeamLeaderService):
         """
         return service.reject_vacation(absence_id)
 
+    @mcp.tool()
+    def approve_vacation_requests(absence_ids: list[int]) -> list[dict]:
+        """
+        Approve several pending vacation/absence requests at once.
+
+        Requests are sent concurrently; use this instead of calling
+        approve_vacation_request repeatedly. The batch is not atomic: failures
+        are reported per absence and do not undo the other updates.
+
+        Args:
+            absence_ids: IDs of the absences to approve
+
+        Returns:
+            One entry per ID, in the given order, with "absence_id", "ok" and
+            either "result" (updated absence data) or "error"
+        """
+        return service.approve_vacations(absence_ids)
+
+    @mcp.tool()
+    def reject_vacation_requests(absence_ids: list[int]) -> list[dict]:
+        """
+        Reject several pending vacation/absence requests at once.
+
+        Requests are sent concurrently; use this instead of calling
+        reject_vacation_request repeatedly. The batch is not atomic: failures
+        are reported per absence and do not undo the other updates.
+
+        Args:
+            absence_ids: IDs of the absences to reject
+
+        Returns:
+            One entry per ID, in the given order, with "absence_id", "ok" and
+            either "result" (updated absence data) or "error"
+        """
+        return service.reject_vacations(absence_ids)
+
     @mcp.tool()
     def adjust_vacation_dates(
         absence_id: int,
@@ -127,6 +166,40 @@ def register_team_leader_tools(mcp, service: TeamLeaderService):
             auto_approve=auto_approve,
         )
 
+    @mcp.tool()
+    def create_team_member_vacations(
+        user_ids: list[int],
+        date_since: str,
+        date_until: str,
+        absence_type: int = 1,
+        auto_approve: bool = True,
+    ) -> list[dict]:
+        """
+        Create the same vacation entry for several team members at once.
+
+        Requests are sent concurrently. By default, entries are auto-approved.
+        The batch is not atomic: vacations created before a failure are kept,
+        so only retry the users whose entry has "ok": false.
+
+        Args:
+            user_ids: User IDs of the team members
+            date_since: Start date (YYYY-MM-DD)
+            date_until: End date (YYYY-MM-DD)
+            absence_type: Type of absence (1=Vacation, 2=Illness, 3=Special leave, etc.)
+            auto_approve: If True, approve immediately (default: True)
+
+        Returns:
+            One entry per user, in the given order, with "user_id", "ok" and
+            either "result" (created absence data) or "error"
+        """
+        return service.create_team_vacations(
+            user_ids=user_ids,
+            date_since=date_since,
+            date_until=date_until,
+            absence_type=absence_type,
+            auto_approve=auto_approve,
+        )
+
     @mcp.tool()
     def edit_team_member_entry(entry_id: int, data: dict) -> dict:
         """
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from ..client import ClockodoClient
+from functools import lru_cache
+
+from ..client import get_default_client, on_default_client_reset
 from ..services.user_service import UserService
 
 
+@lru_cache(maxsize=1)
+def _service() -> UserService:
+    """
+    Return the UserService shared by all user tools.
+
+    Sharing one instance keeps the resolved user ID across tool calls, so
+    `list_users()` is only needed once per process (or never, if
+    CLOCKODO_USER_ID is set).
+    """
+    client = get_default_client()
+    return UserService(client, user_id=client.user_id)
+
+
+# Rebuild the service (and its client reference) after the client is reset
+on_default_client_reset(_service.cache_clear)
+
+
 def get_my_clock() -> dict:
     """Get the currently running clock for the authenticated user."""
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.get_my_clock()
+    return _service().get_my_clock()
 
 
 def start_my_clock(
@@ -30,9 +47,7 @@ def start_my_clock(
         projects_id: Optional project ID
         text: Optional description
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.start_my_clock(
+    return _service().start_my_clock(
         customers_id=customers_id,
         services_id=services_id,
         billable=billable,
@@ -43,9 +58,7 @@ def start_my_clock(
 
 def stop_my_clock() -> dict:
     """Stop the currently running clock for the authenticated user."""
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.stop_my_clock()
+    return _service().stop_my_clock()
 
 
 def add_my_vacation(date_since: str, date_until: str) -> dict:
@@ -56,9 +69,7 @@ def add_my_vacation(date_since: str, date_until: str) -> dict:
         date_since: Start date (YYYY-MM-DD)
         date_until: End date (YYYY-MM-DD)
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.add_my_vacation(date_since, date_until)
+    return _service().add_my_vacation(date_since, date_until)
 
 
 def get_my_entries(time_since: str, time_until: str) -> dict:
@@ -69,9 +80,7 @@ def get_my_entries(time_since: str, time_until: str) -> dict:
         time_since: Start time (e.g., 2025-01-01T00:00:00Z)
         time_until: End time (e.g., 2025-01-01T23:59:59Z)
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.get_my_entries(time_since, time_until)
+    return _service().get_my_entries(time_since, time_until)
 
 
 def add_my_entry(
@@ -95,9 +104,7 @@ def add_my_entry(
         projects_id: Optional project ID
         text: Optional description
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.add_my_entry(
+    return _service().add_my_entry(
         customers_id=customers_id,
         services_id=services_id,
         time_since=time_since,
@@ -116,9 +123,7 @@ def edit_my_entry(entry_id: int, data: dict) -> dict:
         entry_id: ID of the entry to edit
         data: Dictionary of fields to update (e.g., {"text": "new description"})
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.edit_my_entry(entry_id, data)
+    return _service().edit_my_entry(entry_id, data)
 
 
 def delete_my_entry(entry_id: int) -> dict:
@@ -128,9 +133,7 @@ def delete_my_entry(entry_id: int) -> dict:
     Args:
         entry_id: ID of the entry to delete
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.delete_my_entry(entry_id)
+    return _service().delete_my_entry(entry_id)
 
 
 def delete_my_vacation(absence_id: int) -> dict:
@@ -140,6 +143,4 @@ def delete_my_vacation(absence_id: int) -> dict:
     Args:
         absence_id: ID of the absence to delete
     """
-    client = ClockodoClient.from_env()
-    service = UserService(client)
-    return service.delete_my_vacation(absence_id)
+    return _service().delete_my_vacation(absence_id)
@@ -1,8 +1,16 @@
+import gc
+
 import httpx
 import pytest
 import respx
 
-from clockodo_mcp.client import DEFAULT_BASE_URL, ClockodoClient
+from clockodo_mcp.client import (
+    DEFAULT_BASE_URL,
+    ClockodoClient,
+    get_default_client,
+    on_default_client_reset,
+    reset_default_client,
+)
 
 
 def test_clockodo_client_builds_auth_headers_from_env(monkeypatch):
@@ -18,6 +26,15 @@ def test_clockodo_client_builds_auth_headers_from_env(monkeypatch):
     assert headers["User-Agent"].startswith("clockodo-mcp/")
 
 
+def test_clockodo_client_user_id_from_env(monkeypatch):
+    """Test that CLOCKODO_USER_ID is optional and parsed as an integer."""
+    monkeypatch.delenv("CLOCKODO_USER_ID", raising=False)
+    assert ClockodoClient.from_env().user_id is None
+
+    monkeypatch.setenv("CLOCKODO_USER_ID", "424873")
+    assert ClockodoClient.from_env().user_id == 424873
+
+
 def test_clockodo_client_base_url_default():
     client = ClockodoClient(api_user="u", api_key="k")
     assert client.base_url.endswith("/api/")
@@ -121,3 +138,161 @@ def test_get_user_reports_error_without_json():
 
     with pytest.raises(httpx.HTTPStatusError):
         client.get_user_reports(year=2024)
+
+
+@respx.mock
+def test_client_reuses_pooled_http_client():
+    """Test that consecutive requests share one persistent httpx.Client."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+    http = client._http  # pylint: disable=protected-access
+
+    respx.get(f"{DEFAULT_BASE_URL}v2/clock").mock(
+        return_value=httpx.Response(200, json={"running": None})
+    )
+
+    client.get_clock()
+    client.get_clock()
+
+    assert client._http is http  # pylint: disable=protected-access
+    assert not http.is_closed
+
+
+def test_client_rejects_absolute_endpoint():
+    """Test that endpoints must use the canonical relative form."""
+    client = ClockodoClient(api_user="u", api_key="k")
+
+    with pytest.raises(ValueError, match="relative"):
+        client._request("GET", "/v3/users")  # pylint: disable=protected-access
+
+
+@respx.mock
+def test_client_fails_fast_on_connect():
+    """Test that requests connect with a shorter timeout than they read."""
+    client = ClockodoClient(api_user="u", api_key="k")
+    route = respx.get(f"{DEFAULT_BASE_URL}v2/clock").mock(
+        return_value=httpx.Response(200, json={"running": None})
+    )
+
+    client.get_clock()
+
+    timeout = route.calls[0].request.extensions["timeout"]
+    assert timeout["connect"] == 5.0
+    assert timeout["read"] == 30.0
+
+
+def test_client_honours_proxy_environment(monkeypatch):
+    """Test that HTTPS_PROXY still applies alongside the custom transport."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.example.com")
+
+    client = ClockodoClient(api_user="u", api_key="k")
+    http = client._http  # pylint: disable=protected-access
+    transport = http._transport_for_url(  # pylint: disable=protected-access
+        httpx.URL(DEFAULT_BASE_URL)
+    )
+    direct = http._transport_for_url(  # pylint: disable=protected-access
+        httpx.URL("https://internal.example.com/")
+    )
+
+    assert transport is not http._transport  # pylint: disable=protected-access
+    assert direct is http._transport  # pylint: disable=protected-access
+
+
+def test_client_no_proxy_wildcard_disables_proxies(monkeypatch):
+    """Test that NO_PROXY=* routes everything through the direct transport."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+    monkeypatch.setenv("NO_PROXY", "*")
+
+    client = ClockodoClient(api_user="u", api_key="k")
+    http = client._http  # pylint: disable=protected-access
+    transport = http._transport_for_url(  # pylint: disable=protected-access
+        httpx.URL(DEFAULT_BASE_URL)
+    )
+
+    assert transport is http._transport  # pylint: disable=protected-access
+
+
+def test_client_context_manager_closes_pool():
+    """Test that leaving the context manager closes the connection pool."""
+    with ClockodoClient(api_user="u", api_key="k") as client:
+        assert not client._http.is_closed  # pylint: disable=protected-access
+
+    assert client._http.is_closed  # pylint: disable=protected-access
+
+
+@respx.mock
+def test_client_error_details_include_json_body():
+    """Test that the JSON error body is part of the raised error message."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+
+    respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(422, json={"error": {"message": "Bad field"}})
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        client.list_users()
+
+    assert "Bad field" in str(exc_info.value)
+    assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
+
+
+@respx.mock
+def test_client_error_details_include_text_body():
+    """Test that non-JSON error bodies are kept as text instead of dropped."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+
+    respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(502, text="Bad Gateway")
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        client.get_user_reports(year=2024)
+
+    assert "Bad Gateway" in str(exc_info.value)
+    assert exc_info.value.response.status_code == 502
+
+
+def test_client_uses_slots():
+    """Test that client instances have no per-instance __dict__."""
+    client = ClockodoClient(api_user="u", api_key="k")
+
+    assert not hasattr(client, "__dict__")
+
+
+def test_default_client_is_shared(monkeypatch):
+    """Test that get_default_client returns one instance until reset."""
+    monkeypatch.setenv("CLOCKODO_API_USER", "u@example.com")
+    monkeypatch.setenv("CLOCKODO_API_KEY", "k")
+    reset_default_client()
+
+    client = get_default_client()
+    assert get_default_client() is client
+
+    reset_default_client()
+    assert client._http.is_closed  # pylint: disable=protected-access
+    assert get_default_client() is not client
+    reset_default_client()
+
+
+def test_reset_default_client_runs_hooks(monkeypatch):
+    """Test that caches holding the shared client are cleared on reset."""
+    monkeypatch.setenv("CLOCKODO_API_USER", "u@example.com")
+    monkeypatch.setenv("CLOCKODO_API_KEY", "k")
+    calls = []
+    monkeypatch.setattr("clockodo_mcp.client._RESET_HOOKS", [])
+
+    on_default_client_reset(lambda: calls.append(1))
+    reset_default_client()
+
+    assert calls == [1]
+
+
+def test_client_pool_closed_when_garbage_collected():
+    """Test that an unclosed client releases its pool once unreferenced."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+    http = client._http  # pylint: disable=protected-access
+
+    del client
+    gc.collect()
+
+    assert http.is_closed
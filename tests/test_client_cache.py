@@ -0,0 +1,276 @@
+from datetime import date
+
+import httpx
+import pytest
+import respx
+
+from clockodo_mcp.client import DEFAULT_BASE_URL, ClockodoClient
+
+
+@respx.mock
+def test_list_users_is_served_from_cache():
+    """Test that repeated list_users calls hit the API only once."""
+    client = ClockodoClient(api_user="u", api_key="k")
+    route = respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(200, json={"data": [{"id": 1}]})
+    )
+
+    first = client.list_users()
+    second = client.list_users()
+
+    assert route.call_count == 1
+    assert second is first
+    assert second["users"] == [{"id": 1}]
+
+
+@respx.mock
+def test_cache_is_keyed_per_endpoint():
+    """Test that each reference-data endpoint has its own cache entry."""
+    client = ClockodoClient(api_user="u", api_key="k")
+    customers = respx.get(f"{DEFAULT_BASE_URL}v3/customers").mock(
+        return_value=httpx.Response(200, json={"customers": [{"id": 10}]})
+    )
+    projects = respx.get(f"{DEFAULT_BASE_URL}v4/projects").mock(
+        return_value=httpx.Response(200, json={"data": [{"id": 20}]})
+    )
+
+    assert client.list_customers()["customers"] == [{"id": 10}]
+    assert client.list_projects()["projects"] == [{"id": 20}]
+    client.list_customers()
+    client.list_projects()
+
+    assert customers.call_count == 1
+    assert projects.call_count == 1
+
+
+@respx.mock
+def test_cache_disabled_with_zero_ttl():
+    """Test that cache_ttl=0 always goes to the API."""
+    client = ClockodoClient(api_user="u", api_key="k", cache_ttl=0)
+    route = respx.get(f"{DEFAULT_BASE_URL}v4/services").mock(
+        return_value=httpx.Response(200, json={"services": []})
+    )
+
+    client.list_services()
+    client.list_services()
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_cache_expires_after_ttl(monkeypatch):
+    """Test that entries older than cache_ttl are refetched."""
+    now = [1000.0]
+    monkeypatch.setattr("clockodo_mcp.client.time.monotonic", lambda: now[0])
+    client = ClockodoClient(api_user="u", api_key="k", cache_ttl=60)
+    route = respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(200, json={"users": []})
+    )
+
+    client.list_users()
+    now[0] += 59
+    client.list_users()
+    assert route.call_count == 1
+
+    now[0] += 2
+    client.list_users()
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_expired_entries_are_evicted(monkeypatch):
+    """Test that storing a new entry drops entries that have expired."""
+    now = [1000.0]
+    monkeypatch.setattr("clockodo_mcp.client.time.monotonic", lambda: now[0])
+    client = ClockodoClient(api_user="u", api_key="k", cache_ttl=60)
+    respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(200, json={"users": []})
+    )
+    respx.get(f"{DEFAULT_BASE_URL}v3/customers").mock(
+        return_value=httpx.Response(200, json={"customers": []})
+    )
+
+    client.list_users()
+    now[0] += 61
+    client.list_customers()
+
+    assert "users" not in client._cache  # pylint: disable=protected-access
+    assert "customers" in client._cache  # pylint: disable=protected-access
+
+
+@respx.mock
+def test_invalidate_drops_single_key_or_everything():
+    """Test explicit cache invalidation."""
+    client = ClockodoClient(api_user="u", api_key="k")
+    users = respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(200, json={"users": []})
+    )
+    customers = respx.get(f"{DEFAULT_BASE_URL}v3/customers").mock(
+        return_value=httpx.Response(200, json={"customers": []})
+    )
+    client.list_users()
+    client.list_customers()
+
+    client.invalidate("users")
+    client.list_users()
+    client.list_customers()
+    assert users.call_count == 2
+    assert customers.call_count == 1
+
+    client.invalidate()
+    client.list_users()
+    client.list_customers()
+    assert users.call_count == 3
+    assert customers.call_count == 2
+
+
+def test_cache_ttl_from_env(monkeypatch):
+    """Test that CLOCKODO_CACHE_TTL configures the cache lifetime."""
+    monkeypatch.setenv("CLOCKODO_CACHE_TTL", "0")
+
+    client = ClockodoClient.from_env()
+
+    assert client.cache_ttl == 0
+
+
+@respx.mock
+def test_past_year_reports_are_persisted_to_disk(tmp_path):
+    """Test that reports of closed years are read back from the disk cache."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": [{"users_id": 1}]})
+    )
+
+    first = ClockodoClient(api_user="u", api_key="k", cache_dir=str(tmp_path))
+    assert first.get_user_reports(year=2000)["userreports"][0]["users_id"] == 1
+
+    # A new client (e.g. after a restart) reuses the persisted report
+    second = ClockodoClient(api_user="u", api_key="k", cache_dir=str(tmp_path))
+    assert second.get_user_reports(year=2000)["userreports"][0]["users_id"] == 1
+
+    assert route.call_count == 1
+    assert len(list(tmp_path.glob("userreports-v1-*.json"))) == 1
+
+
+@respx.mock
+def test_disk_cache_is_keyed_by_account_and_parameters(tmp_path):
+    """Test that accounts and report parameters never share cache entries."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    alice = ClockodoClient(api_user="alice", api_key="k", cache_dir=str(tmp_path))
+    bob = ClockodoClient(api_user="bob", api_key="k", cache_dir=str(tmp_path))
+
+    alice.get_user_reports(year=2000)
+    alice.get_user_reports(year=2000, user_id=5)
+    alice.get_user_reports(year=2000, type_level=2)
+    bob.get_user_reports(year=2000)
+
+    assert route.call_count == 4
+
+
+@respx.mock
+def test_current_year_reports_are_not_persisted(tmp_path):
+    """Test that the still-changing current year always hits the API."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    client = ClockodoClient(
+        api_user="u", api_key="k", cache_ttl=0, cache_dir=str(tmp_path)
+    )
+    year = date.today().year
+
+    client.get_user_reports(year=year)
+    client.get_user_reports(year=year)
+
+    assert route.call_count == 2
+    assert not list(tmp_path.iterdir())
+
+
+@respx.mock
+def test_corrupt_cache_file_is_refetched(tmp_path):
+    """Test that an unreadable cache file falls back to the API."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    client = ClockodoClient(
+        api_user="u", api_key="k", cache_ttl=0, cache_dir=str(tmp_path)
+    )
+    client.get_user_reports(year=2000)
+    for path in tmp_path.glob("*.json"):
+        path.write_text("not json")
+
+    assert client.get_user_reports(year=2000) == {"userreports": []}
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_user_reports_are_cached_in_memory():
+    """Test that repeated report requests for one year share a response."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    client = ClockodoClient(api_user="u", api_key="k")
+    year = date.today().year
+
+    client.get_user_reports(year=year)
+    client.get_user_reports(year=year)
+    client.get_user_reports(year=year, user_id=5)
+    client.invalidate(f"userreports:{year}:None:0")
+    client.get_user_reports(year=year)
+
+    assert route.call_count == 3
+
+    client.invalidate(prefix="userreports:")
+    client.get_user_reports(year=year)
+    client.get_user_reports(year=year, user_id=5)
+
+    assert route.call_count == 5
+
+
+@respx.mock
+def test_user_reports_can_bypass_the_cache(tmp_path):
+    """Test that use_cache=False always queries the API and stores nothing."""
+    route = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    client = ClockodoClient(api_user="u", api_key="k", cache_dir=str(tmp_path))
+
+    client.get_user_reports(year=2000)
+    client.get_user_reports(year=2000, use_cache=False)
+    client.get_user_reports(year=2000, use_cache=False)
+
+    assert route.call_count == 3
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+@respx.mock
+def test_writes_invalidate_cached_user_reports():
+    """Test that entry and absence writes drop cached reports but not reference data."""
+    reports = respx.get(f"{DEFAULT_BASE_URL}userreports").mock(
+        return_value=httpx.Response(200, json={"userreports": []})
+    )
+    users = respx.get(f"{DEFAULT_BASE_URL}v3/users").mock(
+        return_value=httpx.Response(200, json={"users": []})
+    )
+    respx.put(f"{DEFAULT_BASE_URL}v2/entries/7").mock(
+        return_value=httpx.Response(200, json={"entry": {"id": 7}})
+    )
+    respx.post(f"{DEFAULT_BASE_URL}v4/absences").mock(
+        return_value=httpx.Response(500, json={"error": {"message": "boom"}})
+    )
+    client = ClockodoClient(api_user="u", api_key="k")
+    year = date.today().year
+
+    client.list_users()
+    client.get_user_reports(year=year)
+    client.edit_entry(7, {"text": "x"})
+    client.get_user_reports(year=year)
+    assert reports.call_count == 2
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.create_absence("2026-01-05", "2026-01-06", absence_type=1)
+    client.get_user_reports(year=year)
+    assert reports.call_count == 3
+
+    client.list_users()
+    assert users.call_count == 1
@@ -324,3 +324,51 @@ def test_list_entries_without_user_filter():
     # Verify no filter[users_id] parameter when user_id is None
     assert route.calls[0].request.url.params.get("filter[users_id]") is None
     assert len(data["entries"]) == 2
+
+
+@respx.mock
+def test_list_entries_batch_fetches_each_user():
+    """Test that list_entries_batch returns one response per user ID."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+
+    def entries_for_user(request):
+        user_id = int(request.url.params["filter[users_id]"])
+        return httpx.Response(200, json={"entries": [{"users_id": user_id}]})
+
+    route = respx.get(f"{DEFAULT_BASE_URL}v2/entries").mock(
+        side_effect=entries_for_user
+    )
+
+    data = client.list_entries_batch(
+        time_since="2025-12-29T00:00:00Z",
+        time_until="2025-12-29T23:59:59Z",
+        user_ids=[1, 2, 3],
+    )
+
+    assert route.call_count == 3
+    assert list(data) == [1, 2, 3]
+    assert data[2]["entries"][0]["users_id"] == 2
+
+
+def test_list_entries_batch_with_no_users():
+    """Test that an empty batch makes no requests."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+
+    assert not client.list_entries_batch("a", "b", user_ids=[])
+
+
+@respx.mock
+def test_json_body_is_sent_with_content_type():
+    """Test that request bodies are JSON-encoded with the matching header."""
+    client = ClockodoClient(api_user="u@example.com", api_key="k")
+
+    route = respx.put(f"{DEFAULT_BASE_URL}v4/absences/7").mock(
+        return_value=httpx.Response(200, json={"data": {"id": 7, "status": 1}})
+    )
+
+    client.edit_absence(7, {"status": 1})
+
+    request = route.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["X-ClockodoApiUser"] == "u@example.com"
+    assert json.loads(request.content) == {"status": 1}
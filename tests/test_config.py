@@ -1,4 +1,8 @@
-from clockodo_mcp.config import FeatureGroup, ServerConfig
+import dataclasses
+
+import pytest
+
+from clockodo_mcp.config import FeatureGroup, ServerConfig, get_server_config
 
 
 def test_default_config_has_only_hr_readonly():
@@ -140,3 +144,37 @@ def test_config_host_with_role(monkeypatch):
     monkeypatch.setenv("CLOCKODO_MCP_HOST", "localhost")
     config = ServerConfig.from_env()
     assert config.host == "localhost"
+
+
+def test_config_is_immutable():
+    """Test that flags cannot change after is_enabled has been precomputed."""
+    config = ServerConfig(hr_readonly=True)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.hr_readonly = False  # type: ignore[misc]
+
+    assert config.is_enabled(FeatureGroup.HR_READONLY) is True
+    assert config.is_enabled(FeatureGroup.ADMIN_EDIT) is False
+
+
+def test_config_get_enabled_features_returns_copy():
+    """Test that callers cannot mutate the precomputed feature summary."""
+    config = ServerConfig(user_read=True, user_edit=True)
+
+    config.get_enabled_features().append("tampered")
+
+    assert config.get_enabled_features() == ["Role: employee"]
+
+
+def test_get_server_config_is_cached(monkeypatch):
+    """Test that the shared config is parsed once until the cache is cleared."""
+    monkeypatch.setenv("CLOCKODO_MCP_ROLE", "employee")
+    get_server_config.cache_clear()
+
+    config = get_server_config()
+    monkeypatch.setenv("CLOCKODO_MCP_ROLE", "admin")
+    assert get_server_config() is config
+
+    get_server_config.cache_clear()
+    assert get_server_config().get_role_name() == "admin"
+    get_server_config.cache_clear()
@@ -41,3 +41,10 @@ def test_space_separated_with_timezone_offset():
     assert (
         normalize_datetime("2025-01-01 09:00:00+01:00") == "2025-01-01T09:00:00+01:00"
     )
+
+
+def test_negative_timezone_offset_passthrough():
+    """Negative offsets are timezone info too and must not get Z appended."""
+    assert (
+        normalize_datetime("2025-01-01T09:00:00-05:00") == "2025-01-01T09:00:00-05:00"
+    )
@@ -1,7 +1,11 @@
+import math
+
 from clockodo_mcp.hr_analyzer import (
     analyze_overtime,
     analyze_vacation,
     get_hr_violations,
+    iter_hr_violations,
+    iter_report_violations,
 )
 
 
@@ -268,3 +272,78 @@ def test_get_hr_violations_handles_missing_year_and_null_reports():
     # Test completely null reports
     assert not get_hr_violations({}, config)
     assert not get_hr_violations({"userreports": None}, config)
+
+
+def test_get_hr_violations_skips_disabled_checks():
+    reports = {
+        "userreports": [
+            {
+                "users_id": 1,
+                "users_name": "Alice",
+                "diff": 360000,  # 100 hours
+                "holidays_quota": 20,
+                "sum_absence": {"regular_holidays": 0.0},
+            }
+        ]
+    }
+
+    config = {
+        "max_overtime_hours": math.inf,
+        "min_vacation_days": 0,
+        "max_vacation_remaining": math.inf,
+    }
+
+    violations = get_hr_violations(reports, config)
+
+    assert len(violations) == 1
+    assert violations[0]["violations"] == []
+
+
+def test_get_hr_violations_negative_infinite_threshold_still_checks():
+    """Only +inf disables the overtime check; -inf flags any overtime."""
+    reports = {"userreports": [{"users_id": 1, "users_name": "A", "diff": 3600}]}
+    config = {
+        "max_overtime_hours": -math.inf,
+        "min_vacation_days": 0,
+        "max_vacation_remaining": math.inf,
+    }
+
+    violations = get_hr_violations(reports, config)
+
+    assert violations[0]["violations"][0]["type"] == "excessive_overtime"
+    assert violations[0]["violations"][0]["excess_hours"] == math.inf
+
+
+def test_iter_hr_violations_yields_one_result_per_report():
+    reports = {
+        "userreports": [
+            {"users_id": 1, "diff": 360000},  # 100 hours
+            {"users_id": 2, "diff": 0},
+        ]
+    }
+    config = {
+        "max_overtime_hours": 80,
+        "min_vacation_days": 10,
+        "max_vacation_remaining": 20,
+    }
+
+    results = iter_hr_violations(reports, config)
+
+    assert next(results)["violations"][0]["type"] == "excessive_overtime"
+    assert next(results)["violations"] == []
+    assert next(results, None) is None
+
+
+def test_iter_report_violations_takes_the_report_list():
+    config = {
+        "year": 2024,
+        "max_overtime_hours": 80,
+        "min_vacation_days": 0,
+        "max_vacation_remaining": math.inf,
+    }
+
+    results = list(iter_report_violations(({"users_id": 1, "diff": 360000},), config))
+
+    assert results[0]["user_id"] == 1
+    assert results[0]["year"] == 2024
+    assert results[0]["violations"][0]["type"] == "excessive_overtime"
@@ -22,9 +22,7 @@ def test_get_current_time_entry_resource_no_running_clock(mock_client):
     """Test current time entry resource when no clock is running."""
     mock_client.get_clock.return_value = {}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_current_time_entry_resource()
 
     assert result["uri"] == "clockodo://current-entry"
@@ -45,9 +43,7 @@ def test_get_current_time_entry_resource_with_running_clock(mock_client):
         }
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_current_time_entry_resource()
 
     assert result["uri"] == "clockodo://current-entry"
@@ -67,9 +63,7 @@ def test_get_user_profile_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_user_profile_resource()
 
     assert result["uri"] == "clockodo://user-profile"
@@ -88,9 +82,7 @@ def test_get_customers_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_customers_resource()
 
     assert result["uri"] == "clockodo://customers"
@@ -106,9 +98,7 @@ def test_get_customers_resource_empty(mock_client):
     """Test customers resource with no customers."""
     mock_client.list_customers.return_value = {"customers": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_customers_resource()
 
     assert result["content"]["count"] == 0
@@ -126,9 +116,7 @@ def test_get_services_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_services_resource()
 
     assert result["uri"] == "clockodo://services"
@@ -144,9 +132,7 @@ def test_get_services_resource_empty(mock_client):
     """Test services resource with no services."""
     mock_client.list_services.return_value = {"services": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_services_resource()
 
     assert result["content"]["count"] == 0
@@ -163,9 +149,7 @@ def test_get_projects_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_projects_resource()
 
     assert result["uri"] == "clockodo://projects"
@@ -181,9 +165,7 @@ def test_get_projects_resource_empty(mock_client):
     """Test projects resource with no projects."""
     mock_client.list_projects.return_value = {"projects": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_projects_resource()
 
     assert result["content"]["count"] == 0
@@ -201,9 +183,7 @@ def test_get_recent_entries_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_recent_entries_resource(days=7)
 
     assert "clockodo://recent-entries?days=7" in result["uri"]
@@ -226,9 +206,7 @@ def test_get_recent_entries_resource_custom_days(mock_client):
     """Test recent entries resource with custom days parameter."""
     mock_client.list_entries.return_value = {"entries": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_recent_entries_resource(days=14)
 
     assert "clockodo://recent-entries?days=14" in result["uri"]
@@ -240,9 +218,7 @@ def test_get_recent_entries_resource_empty(mock_client):
     """Test recent entries resource with no entries."""
     mock_client.list_entries.return_value = {"entries": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = resources.get_recent_entries_resource(days=7)
 
     assert result["content"]["count"] == 0
@@ -1,3 +1,10 @@
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+from clockodo_mcp import server as server_module
 from clockodo_mcp.config import ServerConfig
 from clockodo_mcp.server import create_server
 
@@ -163,3 +170,44 @@ def test_server_admin_edit_only():
 
     # Admin read tools absent
     assert "get_all_time_entries" not in server.tool_names
+
+
+def test_register_tools_is_idempotent():
+    """Test that calling register_tools again does not re-register tools."""
+    server_module.register_tools()
+
+    with patch.object(server_module.mcp, "tool") as tool:
+        server_module.register_tools()
+
+    tool.assert_not_called()
+
+
+_LIST_TOOLS_SCRIPT = """
+import asyncio, json
+from clockodo_mcp.server import mcp, register_tools
+
+def names():
+    return sorted(tool.name for tool in asyncio.run(mcp.list_tools()))
+
+imported = names()
+register_tools()
+print(json.dumps({"imported": imported, "registered": names()}))
+"""
+
+
+def test_imported_mcp_needs_register_tools_for_role_tools():
+    """Test that importing `mcp` without main() exposes only the core tools."""
+    # A fresh interpreter, since other tests register tools on the shared mcp
+    env = {**os.environ, "CLOCKODO_MCP_ROLE": "employee"}
+    result = subprocess.run(
+        [sys.executable, "-c", _LIST_TOOLS_SCRIPT],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    tools = json.loads(result.stdout)
+
+    assert "health" in tools["imported"]
+    assert "get_my_clock" not in tools["imported"]
+    assert "get_my_clock" in tools["registered"]
@@ -4,6 +4,7 @@ Tests for MCP prompts and resources registration in server.py.
 
 # pylint: disable=redefined-outer-name  # pytest fixtures
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,9 +53,7 @@ def test_current_entry_resource_no_clock(mock_client):
     """Test current_entry resource when no clock is running."""
     mock_client.get_clock.return_value = {}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.current_entry()
 
     # Should return JSON string
@@ -73,9 +72,7 @@ def test_current_entry_resource_with_clock(mock_client):
         }
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.current_entry()
 
     assert isinstance(result, str)
@@ -93,15 +90,13 @@ def test_customers_list_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.customers_list()
 
     assert isinstance(result, str)
     assert "ACME Corp" in result
     assert "TechStart Inc" in result
-    assert '"count": 2' in result
+    assert json.loads(result)["count"] == 2
 
 
 def test_services_list_resource(mock_client):
@@ -113,15 +108,13 @@ def test_services_list_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.services_list()
 
     assert isinstance(result, str)
     assert "Development" in result
     assert "Design" in result
-    assert '"count": 2' in result
+    assert json.loads(result)["count"] == 2
 
 
 def test_recent_entries_resource(mock_client):
@@ -133,15 +126,13 @@ def test_recent_entries_resource(mock_client):
         ]
     }
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.recent_entries()
 
     assert isinstance(result, str)
     assert "ACME Corp" in result
     assert "TechStart Inc" in result
-    assert '"count": 2' in result
+    assert json.loads(result)["count"] == 2
     assert "period" in result
 
 
@@ -149,10 +140,8 @@ def test_recent_entries_resource_empty(mock_client):
     """Test recent_entries resource with no entries."""
     mock_client.list_entries.return_value = {"entries": []}
 
-    with patch(
-        "clockodo_mcp.resources.ClockodoClient.from_env", return_value=mock_client
-    ):
+    with patch("clockodo_mcp.resources.get_default_client", return_value=mock_client):
         result = server.recent_entries()
 
     assert isinstance(result, str)
-    assert '"count": 0' in result
+    assert json.loads(result)["count"] == 0
@@ -1,6 +1,13 @@
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
+import pytest
+
+from clockodo_mcp import server as server_module
+from clockodo_mcp.client import get_default_client, reset_default_client
 from clockodo_mcp.server import create_server
+from clockodo_mcp.tools import user_tools
 from clockodo_mcp.tools.debug_tools import get_raw_user_reports
 from clockodo_mcp.tools.hr_tools import (
     check_overtime_compliance,
@@ -20,6 +27,14 @@ from clockodo_mcp.tools.user_tools import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_user_service():
+    """Drop the shared UserService so each test sees its own mock client."""
+    user_tools._service.cache_clear()  # pylint: disable=protected-access
+    yield
+    user_tools._service.cache_clear()  # pylint: disable=protected-access
+
+
 def test_server_list_users_tool_calls_client():
     mock_client = Mock()
     mock_client.list_users.return_value = {"users": [{"id": 1}]}
@@ -72,10 +87,10 @@ def test_server_list_projects_tool_calls_client():
     assert result["projects"][0]["id"] == 300
 
 
-@patch("clockodo_mcp.tools.hr_tools.ClockodoClient")
-def test_check_overtime_compliance_returns_violations(mock_client_class):
+@patch("clockodo_mcp.tools.hr_tools.get_default_client")
+def test_check_overtime_compliance_returns_violations(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.get_user_reports.return_value = {
         "userreports": [
             {
@@ -100,10 +115,10 @@ def test_check_overtime_compliance_returns_violations(mock_client_class):
     assert result["violations"][0]["overtime_hours"] == 100.0
 
 
-@patch("clockodo_mcp.tools.hr_tools.ClockodoClient")
-def test_check_vacation_compliance_returns_violations(mock_client_class):
+@patch("clockodo_mcp.tools.hr_tools.get_default_client")
+def test_check_vacation_compliance_returns_violations(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.get_user_reports.return_value = {
         "userreports": [
             {
@@ -128,10 +143,10 @@ def test_check_vacation_compliance_returns_violations(mock_client_class):
     assert result["violations"][0]["user_name"] == "Bob"
 
 
-@patch("clockodo_mcp.tools.hr_tools.ClockodoClient")
-def test_get_hr_summary_returns_complete_report(mock_client_class):
+@patch("clockodo_mcp.tools.hr_tools.get_default_client")
+def test_get_hr_summary_returns_complete_report(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.get_user_reports.return_value = {
         "userreports": [
             {
@@ -167,10 +182,10 @@ def test_get_hr_summary_returns_complete_report(mock_client_class):
     assert len(result["employees_with_violations"][0]["violations"]) == 2
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_start_my_clock_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_start_my_clock_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.clock_start.return_value = {"running": {"id": 100}}
 
     result = start_my_clock(customers_id=1, services_id=2)
@@ -181,10 +196,10 @@ def test_start_my_clock_tool(mock_client_class):
     assert result["running"]["id"] == 100
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_stop_my_clock_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_stop_my_clock_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     # Mock get_clock to return a running clock with ID
     mock_client.get_clock.return_value = {"running": {"id": 1001}, "stopped": None}
     mock_client.clock_stop.return_value = {"stopped": {"id": 1001}, "running": None}
@@ -196,10 +211,11 @@ def test_stop_my_clock_tool(mock_client_class):
     assert result["stopped"]["id"] == 1001
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_add_my_vacation_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_add_my_vacation_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = None
     mock_client.api_user = "me@example.com"
     mock_client.list_users.return_value = {
         "users": [{"id": 42, "email": "me@example.com"}]
@@ -214,10 +230,10 @@ def test_add_my_vacation_tool(mock_client_class):
     assert result["absence"]["id"] == 200
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_get_my_clock_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_get_my_clock_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.get_clock.return_value = {"running": None, "stopped": None}
 
     result = get_my_clock()
@@ -226,10 +242,11 @@ def test_get_my_clock_tool(mock_client_class):
     assert result["running"] is None
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_get_my_entries_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_get_my_entries_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = None
     mock_client.api_user = "me@example.com"
     mock_client.list_users.return_value = {
         "users": [{"id": 42, "email": "me@example.com"}]
@@ -244,10 +261,11 @@ def test_get_my_entries_tool(mock_client_class):
     assert result["entries"][0]["id"] == 100
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_add_my_entry_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_add_my_entry_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = None
     mock_client.api_user = "me@example.com"
     mock_client.list_users.return_value = {
         "users": [{"id": 42, "email": "me@example.com"}]
@@ -266,10 +284,11 @@ def test_add_my_entry_tool(mock_client_class):
     assert result["entry"]["id"] == 300
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_add_my_entry_tool_with_text(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_add_my_entry_tool_with_text(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = None
     mock_client.api_user = "me@example.com"
     mock_client.list_users.return_value = {
         "users": [{"id": 42, "email": "me@example.com"}]
@@ -300,10 +319,58 @@ def test_add_my_entry_tool_with_text(mock_client_class):
     assert result["entry"]["id"] == 301
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_edit_my_entry_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_user_tools_resolve_user_id_once(mock_get_client):
+    """Test that the user ID lookup is shared across tool calls."""
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = None
+    mock_client.api_user = "me@example.com"
+    mock_client.list_users.return_value = {
+        "users": [{"id": 42, "email": "me@example.com"}]
+    }
+
+    get_my_entries("2025-01-01T00:00:00Z", "2025-01-01T23:59:59Z")
+    add_my_vacation(date_since="2025-01-01", date_until="2025-01-05")
+
+    mock_client.list_users.assert_called_once()
+    mock_get_client.assert_called_once()
+
+
+def test_user_service_is_rebuilt_after_client_reset(monkeypatch):
+    """Test that resetting the shared client drops the cached UserService."""
+    monkeypatch.setenv("CLOCKODO_API_USER", "u@example.com")
+    monkeypatch.setenv("CLOCKODO_API_KEY", "k")
+    reset_default_client()
+
+    service = user_tools._service()  # pylint: disable=protected-access
+    reset_default_client()
+    rebuilt = user_tools._service()  # pylint: disable=protected-access
+
+    assert rebuilt is not service
+    assert rebuilt.client is get_default_client()
+    reset_default_client()
+
+
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_user_tools_use_configured_user_id(mock_get_client):
+    """Test that a configured CLOCKODO_USER_ID skips the users lookup."""
+    mock_client = Mock()
+    mock_get_client.return_value = mock_client
+    mock_client.user_id = 7
+
+    add_my_vacation(date_since="2025-01-01", date_until="2025-01-05")
+
+    mock_client.list_users.assert_not_called()
+    mock_client.create_absence.assert_called_once_with(
+        date_since="2025-01-01", date_until="2025-01-05", absence_type=1, user_id=7
+    )
+
+
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_edit_my_entry_tool(mock_get_client):
+    mock_client = Mock()
+    mock_get_client.return_value = mock_client
     mock_client.edit_entry.return_value = {"entry": {"id": 300, "text": "Updated"}}
 
     result = edit_my_entry(entry_id=300, data={"text": "Updated"})
@@ -312,10 +379,10 @@ def test_edit_my_entry_tool(mock_client_class):
     assert result["entry"]["text"] == "Updated"
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_delete_my_entry_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_delete_my_entry_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.delete_entry.return_value = {"success": True}
 
     result = delete_my_entry(entry_id=300)
@@ -324,10 +391,10 @@ def test_delete_my_entry_tool(mock_client_class):
     assert result["success"] is True
 
 
-@patch("clockodo_mcp.tools.user_tools.ClockodoClient")
-def test_delete_my_vacation_tool(mock_client_class):
+@patch("clockodo_mcp.tools.user_tools.get_default_client")
+def test_delete_my_vacation_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.delete_absence.return_value = {"success": True}
 
     result = delete_my_vacation(absence_id=200)
@@ -336,15 +403,33 @@ def test_delete_my_vacation_tool(mock_client_class):
     assert result["success"] is True
 
 
-@patch("clockodo_mcp.tools.debug_tools.ClockodoClient")
-def test_get_raw_user_reports_tool(mock_client_class):
+@patch("clockodo_mcp.tools.debug_tools.get_default_client")
+def test_get_raw_user_reports_tool(mock_get_client):
     mock_client = Mock()
-    mock_client_class.from_env.return_value = mock_client
+    mock_get_client.return_value = mock_client
     mock_client.get_user_reports.return_value = {
         "userreports": [{"users_id": 1, "sum_hours": 144000}]
     }
 
     result = get_raw_user_reports(year=2025)
 
-    mock_client.get_user_reports.assert_called_once_with(year=2025)
+    mock_client.get_user_reports.assert_called_once_with(year=2025, use_cache=False)
     assert result["userreports"][0]["users_id"] == 1
+
+
+@patch("clockodo_mcp.tools.hr_tools.get_default_client")
+def test_server_hr_tool_runs_in_worker_thread(mock_get_client):
+    """Test that the async HR server tool offloads the blocking client call."""
+    loop_thread = threading.get_ident()
+    call_threads = []
+
+    def get_user_reports(year):
+        call_threads.append(threading.get_ident())
+        return {"userreports": []}
+
+    mock_get_client.return_value.get_user_reports.side_effect = get_user_reports
+
+    result = asyncio.run(server_module.check_overtime_compliance(year=2024))
+
+    assert result["violations"] == []
+    assert call_threads and call_threads[0] != loop_thread
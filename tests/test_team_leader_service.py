@@ -3,6 +3,10 @@
 
 from __future__ import annotations
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import respx
 from httpx import Response
@@ -71,6 +75,49 @@ def test_reject_vacation(service, client):
     assert result["absence"]["status"] == 2
 
 
+@respx.mock
+def test_approve_and_reject_vacations_in_batch(service, client):
+    """Test that batch status changes update every absence in order."""
+    route = respx.put(url__regex=rf"{client.base_url}v4/absences/\d+").mock(
+        side_effect=lambda request: Response(
+            200, json={"absence": {"id": int(request.url.path.rsplit("/", 1)[1])}}
+        )
+    )
+
+    approved = service.approve_vacations([1, 2, 3])
+    rejected = service.reject_vacations([4])
+
+    assert [r["result"]["absence"]["id"] for r in approved] == [1, 2, 3]
+    assert [r["absence_id"] for r in approved] == [1, 2, 3]
+    assert all(r["ok"] for r in approved)
+    assert rejected[0]["result"]["absence"]["id"] == 4
+    assert route.call_count == 4
+    statuses = {json.loads(call.request.content)["status"] for call in route.calls}
+    assert statuses == {1, 2}
+    assert service.approve_vacations([]) == []
+
+
+@respx.mock
+def test_approve_vacations_reports_failures_per_absence(service, client):
+    """Test that one failed approval does not hide the others' outcomes."""
+    respx.put(f"{client.base_url}v4/absences/1").mock(
+        return_value=Response(200, json={"absence": {"id": 1, "status": 1}})
+    )
+    respx.put(f"{client.base_url}v4/absences/2").mock(
+        return_value=Response(400, json={"error": {"message": "Invalid status"}})
+    )
+    respx.put(f"{client.base_url}v4/absences/3").mock(
+        return_value=Response(200, json={"absence": {"id": 3, "status": 1}})
+    )
+
+    result = service.approve_vacations([1, 2, 3])
+
+    assert [r["ok"] for r in result] == [True, False, True]
+    assert result[1]["absence_id"] == 2
+    assert "Invalid status" in result[1]["error"]
+    assert result[2]["result"]["absence"]["id"] == 3
+
+
 @respx.mock
 def test_list_pending_vacations(service, client):
     """Test listing pending vacation requests."""
@@ -116,6 +163,25 @@ def test_list_pending_vacations(service, client):
     assert result[1]["id"] == 125
 
 
+@respx.mock
+def test_list_pending_vacations_with_limit(service, client):
+    """Test that the limit caps the number of pending requests returned."""
+    absences = [{"id": i, "status": i % 2} for i in range(10)]
+    respx.get(f"{client.base_url}v4/absences").mock(
+        return_value=Response(200, json={"absences": absences})
+    )
+
+    result = service.list_pending_vacations(2025, limit=2)
+
+    assert [a["id"] for a in result] == [0, 2]
+
+
+def test_list_pending_vacations_rejects_negative_limit(service):
+    """Test that a negative limit fails with a clear error before any request."""
+    with pytest.raises(ValueError, match="limit must be zero or positive"):
+        service.list_pending_vacations(2025, limit=-1)
+
+
 @respx.mock
 def test_edit_team_entry(service, client):
     """Test editing a team member's time entry."""
@@ -230,3 +296,77 @@ def test_create_team_vacation_no_auto_approve(service, client):
 
     assert result == mock_response
     assert result["absence"]["status"] == 0  # enquired
+
+
+@respx.mock
+def test_create_team_vacations(service, client):
+    """Test creating one vacation per team member in a single batch."""
+    route = respx.post(f"{client.base_url}v4/absences").mock(
+        side_effect=lambda request: Response(
+            200, json={"absence": json.loads(request.content)}
+        )
+    )
+
+    result = service.create_team_vacations(
+        user_ids=[42, 43],
+        date_since="2025-12-24",
+        date_until="2025-12-26",
+        auto_approve=True,
+    )
+
+    assert route.call_count == 2
+    assert [r["result"]["absence"]["users_id"] for r in result] == [42, 43]
+    assert all(r["result"]["absence"]["status"] == 1 for r in result)
+
+
+@respx.mock
+def test_create_team_vacations_keeps_going_after_a_failure(service, client):
+    """Test that a failed creation is reported without raising."""
+
+    def create(request):
+        body = json.loads(request.content)
+        if body["users_id"] == 43:
+            return Response(403, json={"error": {"message": "Forbidden"}})
+        return Response(200, json={"absence": body})
+
+    route = respx.post(f"{client.base_url}v4/absences").mock(side_effect=create)
+
+    result = service.create_team_vacations(
+        user_ids=[42, 43, 44], date_since="2025-12-24", date_until="2025-12-26"
+    )
+
+    assert route.call_count == 3
+    assert [(r["user_id"], r["ok"]) for r in result] == [
+        (42, True),
+        (43, False),
+        (44, True),
+    ]
+    assert "Forbidden" in result[1]["error"]
+
+
+def test_client_factory_called_once_under_concurrency():
+    """Test that concurrent first accesses share one lazily created client."""
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    lazy_service = TeamLeaderService(factory)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: lazy_service.client, range(8)))
+
+    assert len(calls) == 1
+    assert all(c is clients[0] for c in clients)
+
+
+def test_reset_client_reloads_from_factory():
+    """Test that reset_client() makes the next access use a fresh client."""
+    clients = iter([object(), object()])
+    lazy_service = TeamLeaderService(lambda: next(clients))
+
+    first = lazy_service.client
+    lazy_service.reset_client()
+
+    assert lazy_service.client is not first
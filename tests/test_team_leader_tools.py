@@ -25,9 +25,12 @@ def test_register_team_leader_tools():
     expected_tools = [
         "list_pending_vacation_requests",
         "approve_vacation_request",
+        "approve_vacation_requests",
         "reject_vacation_request",
+        "reject_vacation_requests",
         "adjust_vacation_dates",
         "create_team_member_vacation",
+        "create_team_member_vacations",
         "edit_team_member_entry",
         "delete_team_member_entry",
     ]
@@ -38,7 +41,7 @@ def test_register_team_leader_tools():
     # Test list_pending_vacation_requests
     mock_service.list_pending_vacations.return_value = [{"id": 1}]
     result = registered_tools["list_pending_vacation_requests"](year=2024)
-    mock_service.list_pending_vacations.assert_called_once_with(2024)
+    mock_service.list_pending_vacations.assert_called_once_with(2024, limit=None)
     assert result == [{"id": 1}]
 
     # Test approve_vacation_request
@@ -75,6 +78,30 @@ def test_register_team_leader_tools():
     )
     assert result == {"id": 126}
 
+    # Test batch variants
+    mock_service.approve_vacations.return_value = [{"status": 1}]
+    result = registered_tools["approve_vacation_requests"](absence_ids=[1, 2])
+    mock_service.approve_vacations.assert_called_once_with([1, 2])
+    assert result == [{"status": 1}]
+
+    mock_service.reject_vacations.return_value = [{"status": 2}]
+    result = registered_tools["reject_vacation_requests"](absence_ids=[3])
+    mock_service.reject_vacations.assert_called_once_with([3])
+    assert result == [{"status": 2}]
+
+    mock_service.create_team_vacations.return_value = [{"id": 127}, {"id": 128}]
+    result = registered_tools["create_team_member_vacations"](
+        user_ids=[42, 43], date_since="2024-12-24", date_until="2024-12-26"
+    )
+    mock_service.create_team_vacations.assert_called_once_with(
+        user_ids=[42, 43],
+        date_since="2024-12-24",
+        date_until="2024-12-26",
+        absence_type=1,
+        auto_approve=True,
+    )
+    assert result == [{"id": 127}, {"id": 128}]
+
     # Test edit_team_member_entry
     mock_service.edit_team_entry.return_value = {"id": 100}
     result = registered_tools["edit_team_member_entry"](
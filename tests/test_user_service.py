@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
 from clockodo_mcp.services.user_service import UserService
@@ -93,6 +94,36 @@ def test_stop_my_clock():
     client.clock_stop.assert_called_once_with(1001)
 
 
+def test_stop_my_clock_uses_id_from_start():
+    client = MagicMock()
+    client.clock_start.return_value = {"running": {"id": 1001}}
+
+    service = UserService(client)
+    service.start_my_clock(customers_id=123, services_id=456)
+    service.stop_my_clock()
+
+    client.get_clock.assert_not_called()
+    client.clock_stop.assert_called_once_with(1001)
+
+
+def test_stop_my_clock_falls_back_when_cached_id_is_stale():
+    client = MagicMock()
+    client.clock_start.return_value = {"running": {"id": 1001}}
+    client.get_clock.return_value = {"running": {"id": 1002}, "stopped": None}
+    stale = httpx.HTTPStatusError(
+        "not found", request=MagicMock(), response=MagicMock()
+    )
+    client.clock_stop.side_effect = [stale, {"stopped": {"id": 1002}}]
+
+    service = UserService(client)
+    service.start_my_clock(customers_id=123, services_id=456)
+    result = service.stop_my_clock()
+
+    client.get_clock.assert_called_once()
+    assert client.clock_stop.call_args_list[-1].args == (1002,)
+    assert result["stopped"]["id"] == 1002
+
+
 def test_stop_my_clock_raises_when_not_running():
     client = MagicMock()
     # Mock get_clock to return no running clock
@@ -123,33 +154,68 @@ def test_delete_my_vacation_without_auto_cancel():
     client.delete_absence.assert_called_once_with(2001)
 
 
+def _status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("DELETE", "https://my.clockodo.com/api/v4/absences/2001")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(code, request=request)
+    )
+
+
+def test_delete_my_vacation_with_auto_cancel_deletes_directly():
+    """Test that a deletable absence is removed without cancelling it first."""
+    client = MagicMock()
+    client.delete_absence.return_value = {"success": True}
+    service = UserService(client)
+
+    result = service.delete_my_vacation(absence_id=2001, auto_cancel=True)
+
+    client.edit_absence.assert_not_called()
+    client.delete_absence.assert_called_once_with(2001)
+    assert result["success"] is True
+
+
 def test_delete_my_vacation_with_auto_cancel():
+    """Test that a rejected deletion cancels the absence and retries."""
     client = MagicMock()
+    client.delete_absence.side_effect = [_status_error(400), {"success": True}]
     service = UserService(client)
 
-    service.delete_my_vacation(absence_id=2001, auto_cancel=True)
+    result = service.delete_my_vacation(absence_id=2001, auto_cancel=True)
 
-    # Should call edit_absence to cancel (status 3), then delete_absence
+    # Should call edit_absence to cancel (status 3), then delete_absence again
     client.edit_absence.assert_called_once_with(2001, {"status": 3})
-    client.delete_absence.assert_called_once_with(2001)
+    assert client.delete_absence.call_count == 2
+    assert result["success"] is True
 
 
 def test_delete_my_vacation_with_auto_cancel_failure():
-    """Test delete_my_vacation when cancel fails but deletion continues."""
+    """Test delete_my_vacation when cancel fails but deletion is retried."""
     client = MagicMock()
-    client.edit_absence.side_effect = Exception("Cancel failed")
-    client.delete_absence.return_value = {"success": True}
+    client.delete_absence.side_effect = [_status_error(400), {"success": True}]
+    client.edit_absence.side_effect = _status_error(400)
 
     service = UserService(client)
 
-    # Should still attempt deletion even if cancel fails
+    # Should still retry deletion even if cancel fails
     result = service.delete_my_vacation(absence_id=2001, auto_cancel=True)
 
     client.edit_absence.assert_called_once_with(2001, {"status": 3})
-    client.delete_absence.assert_called_once_with(2001)
+    assert client.delete_absence.call_count == 2
     assert result["success"] is True
 
 
+def test_delete_my_vacation_without_auto_cancel_raises():
+    """Test that without auto_cancel a rejected deletion is not retried."""
+    client = MagicMock()
+    client.delete_absence.side_effect = _status_error(400)
+    service = UserService(client)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        service.delete_my_vacation(absence_id=2001)
+
+    client.edit_absence.assert_not_called()
+
+
 def test_add_my_vacation():
     """Test adding vacation for current user."""
     client = MagicMock()